@@ -25,18 +25,22 @@ def convert_indices(indices: Union[str,List[int]], index_convention="lmp"):
     ret = []
     if isinstance(indices, str):
         # string to List[int]
-        for x in indices.strip().split():
-            cur_range = list(map(int, x.split(":")))
-            if len(cur_range) == 1:
-                start, end = cur_range[0], cur_range[0]
-            else:
-                start, end = cur_range
-            if index_convention == "lmp":
-                ret.extend([i-1 for i in list(range(start,end+1))])
-            elif index_convention == "py":
-                ret.extend(list(range(start,end)))
-            else:
-                pass
+        if index_convention in ["lmp", "py"]:
+            ranges = []
+            for x in indices.strip().split():
+                cur_range = list(map(int, x.split(":")))
+                if len(cur_range) == 1:
+                    start, end = cur_range[0], cur_range[0]
+                else:
+                    start, end = cur_range
+                if index_convention == "lmp":
+                    ranges.append(np.arange(start-1, end))
+                else:
+                    ranges.append(np.arange(start, end))
+            if ranges:
+                ret = np.concatenate(ranges).tolist()
+        else:
+            pass
     elif isinstance(indices, list):
         # List[int] to string
         indices = sorted(indices)
@@ -120,7 +124,8 @@ def parse_constraint_info(atoms, cons_text, ignore_ase_constraints=True, ret_tex
                 frozen_indices = [i for i in aindices if atoms.positions[i][2] <= float(cons_info)]
             else:
                 pass
-    mobile_indices = [i for i in aindices if i not in frozen_indices]
+    frozen_set = set(frozen_indices)
+    mobile_indices = [i for i in aindices if i not in frozen_set]
     #print(mobile_indices)
     #print(frozen_indices)
 
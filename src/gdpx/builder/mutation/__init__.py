@@ -11,8 +11,10 @@ from ase.ga.soft_mutation import SoftMutation, BondElectroNegativityModel
 
 from gdpx.core.register import registers
 
+from .rattle import VectorisedRattleMutation
+
 # - standard
-registers.builder.register("rattle")(RattleMutation)
+registers.builder.register("rattle")(VectorisedRattleMutation)
 registers.builder.register("permutation")(PermutationMutation)
 registers.builder.register("mirror")(MirrorMutation)
 
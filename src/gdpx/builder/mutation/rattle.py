@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+
+import numpy as np
+
+from ase import Atoms
+from ase.ga.standardmutations import RattleMutation
+from ase.ga.utilities import atoms_too_close, atoms_too_close_two_sets
+
+
+class VectorisedRattleMutation(RattleMutation):
+    """RattleMutation that displaces all selected groups at once.
+
+    ASE draws the random numbers and searches the atoms of each tag one by one,
+    which costs O(N^2) per attempt when tags are not used since every atom is
+    its own group. Here, the groups are mapped once and the displacements of
+    all groups are drawn in two calls per attempt.
+
+    Note:
+        The random numbers are consumed in a different order than ASE does,
+        thus the same random seed gives a different mutant.
+
+    """
+
+    def mutate(self, atoms):
+        """Does the actual mutation."""
+        N = len(atoms) if self.n_top is None else self.n_top
+        slab = atoms[: len(atoms) - N]
+        atoms = atoms[-N:]
+        tags = atoms.get_tags() if self.use_tags else np.arange(N)
+        pos_ref = atoms.get_positions()
+        num = atoms.get_atomic_numbers()
+        cell = atoms.get_cell()
+        pbc = atoms.get_pbc()
+        st = 2.0 * self.rattle_strength
+
+        # - map atoms to their groups
+        _, group_indices = np.unique(tags, return_inverse=True)
+        num_groups = np.max(group_indices) + 1 if N > 0 else 0
+
+        count = 0
+        maxcount = 1000
+        too_close = True
+        while too_close and count < maxcount:
+            count += 1
+            selected = self.rng.rand(num_groups) < self.rattle_prop
+            if not np.any(selected):
+                # Nothing got rattled
+                continue
+            displacements = st * (self.rng.rand(num_groups, 3) - 0.5)
+            displacements[~selected] = 0.0
+            pos = pos_ref + displacements[group_indices]
+
+            top = Atoms(num, positions=pos, cell=cell, pbc=pbc, tags=tags)
+            too_close = atoms_too_close(top, self.blmin, use_tags=self.use_tags)
+            if not too_close and self.test_dist_to_slab:
+                too_close = atoms_too_close_two_sets(top, slab, self.blmin)
+
+        if count == maxcount:
+            return None
+
+        mutant = slab + top
+
+        return mutant
+
+
+if __name__ == "__main__":
+    ...
@@ -5,11 +5,13 @@ import copy
 import pathlib
 import warnings
 
-from typing import List, Mapping
+from typing import List, Mapping, Optional
 from pathlib import Path
 
 import numpy as np
 
+import joblib
+
 import ase
 from ase import units, Atoms
 from ase.io import read, write
@@ -22,10 +24,30 @@ from ase.ga.startgenerator import StartGenerator
 from gdpx.core.register import registers
 from gdpx.builder.builder import StructureBuilder, StructureModifier
 from gdpx.builder.species import build_species
+from gdpx.builder.utils import convert_blmin_to_array
 
 """ Generate structures randomly
 """
 
+#: The upper bound of random states sent to parallel jobs.
+RANDOM_INTEGER_HIGH: int = 2**31
+
+
+def get_new_candidate(generator: StartGenerator, maxiter: int, random_state: int):
+    """Create one candidate by a generator with an independent random state.
+
+    Parallel jobs receive a pickled copy of the generator while a single job
+    runs in this process, so the generator's own random state is restored.
+
+    """
+    prev_rng = generator.rng
+    generator.rng = np.random.RandomState(random_state)
+    atoms = generator.get_new_candidate(maxiter=maxiter)
+    generator.rng = prev_rng
+
+    return atoms
+
+
 def compute_molecule_number_from_density(molecular_mass, volume, density) -> int:
     """Compute the number of molecules in the region with a given density.
 
@@ -61,6 +83,14 @@ class RandomBuilder(StructureModifier):
     #: Composition to insert.
     composition_blocks: Mapping[str,int] = None
 
+    #: Minimum number of structures to create by parallel jobs.
+    #  Creating one structure is cheap so smaller runs are dominated by
+    #  starting the jobs. None disables parallel creation.
+    min_parallel_size: Optional[int] = None
+
+    #: The structure generator reused by runs on the same substrate.
+    _generator: StartGenerator = None
+
     def __init__(
         self, composition: Mapping[str,int], substrates = None,
         region: dict={}, cell=None, covalent_ratio=[0.8, 2.0], 
@@ -87,6 +117,7 @@ class RandomBuilder(StructureModifier):
             cell_volume = kwargs.get("cell_volume", None),
             cell_bounds = kwargs.get("cell_bounds", None),
             cell_splits = kwargs.get("cell_splits", None),
+            min_parallel_size = kwargs.get("min_parallel_size", None),
             random_seed = self.random_seed
         )
 
@@ -136,6 +167,8 @@ class RandomBuilder(StructureModifier):
         self.cell_splits = kwargs.get("cell_splits", None)
         self.number_of_variable_cell_vectors = 0 # number_of_variable_cell_vectors
 
+        self.min_parallel_size = kwargs.get("min_parallel_size", None)
+
         return
     
     def _load_substrates(self, inp_sub) -> List[Atoms]:
@@ -160,9 +193,18 @@ class RandomBuilder(StructureModifier):
         super().run(substrates=substrates, *args, **kwargs)
 
         # - create generator
-        generator = self._create_generator(self.substrates)
+        #   NOTE: Settings are only updated when new substrates are given
+        #         as the generator is reused by runs, for example, in GA.
+        if self._generator is None or substrates is not None:
+            self._generator = self._create_generator(self.substrates)
+        generator = self._generator
 
         # - run over
+        #   NOTE: Large runs draw one random state per candidate so the
+        #         structures do not depend on the number of jobs.
+        if self.min_parallel_size is not None and size >= self.min_parallel_size:
+            return self._prun(generator, size, soft_error)
+
         frames = []
         for i in range(size*self.MAX_TIMES_SIZE):
             nframes = len(frames)
@@ -184,6 +226,38 @@ class RandomBuilder(StructureModifier):
         
         return frames
     
+    def _prun(self, generator: StartGenerator, size: int, soft_error: bool) -> List[Atoms]:
+        """Create candidates by parallel jobs.
+
+        Each round submits as many attempts as the missing structures and
+        the total number of attempts is limited to `size*MAX_TIMES_SIZE`
+        as the serial run. Random states of the jobs are drawn from np.random
+        so the results are reproducible for a given random seed whatever
+        the number of jobs is.
+
+        """
+        frames = []
+        num_attempts = 0
+        while len(frames) < size and num_attempts < size*self.MAX_TIMES_SIZE:
+            num_curr_attempts = min(size - len(frames), size*self.MAX_TIMES_SIZE - num_attempts)
+            random_states = np.random.randint(0, RANDOM_INTEGER_HIGH, size=num_curr_attempts)
+            ret = joblib.Parallel(n_jobs=self.njobs, backend="loky")(
+                joblib.delayed(get_new_candidate)(
+                    generator, self.MAX_ATTEMPTS_PER_CANDIDATE, random_state
+                ) for random_state in random_states
+            )
+            frames.extend([atoms for atoms in ret if atoms is not None])
+            num_attempts += num_curr_attempts
+        nframes = len(frames)
+
+        if nframes < size:
+            if soft_error:
+                warnings.warn(f"Failed to create {size} structures, only {nframes} are created.", UserWarning)
+            else:
+                raise RuntimeError(f"Failed to create {size} structures, only {nframes} are created.")
+
+        return frames
+
     def _update_settings(self, substarte: Atoms=None):
         """"""
 
@@ -254,24 +328,17 @@ class RandomBuilder(StructureModifier):
             # be careful with test too far
             ratio_of_covalent_radii = self.covalent_min
         )
+        # - a dense table indexed by atomic numbers for fast lookups
+        self.blmin_table = convert_blmin_to_array(blmin)
 
         return blmin
 
     def _print_blmin(self, blmin):
         """"""
-        elements = []
-        for k in blmin.keys():
-            elements.extend(k)
-        elements = set(elements)
-        #elements = [ase.data.chemical_symbols[e] for e in set(elements)]
+        elements = sorted(set(e for k in blmin.keys() for e in k))
         nelements = len(elements)
 
-        index_map = {}
-        for i, e in enumerate(elements):
-            index_map[e] = i
-        distance_map = np.zeros((nelements, nelements))
-        for (i, j), dis in blmin.items():
-            distance_map[index_map[i], index_map[j]] = dis
+        distance_map = convert_blmin_to_array(blmin)[np.ix_(elements, elements)]
 
         symbols = [ase.data.chemical_symbols[e] for e in elements]
 
@@ -112,6 +112,28 @@ def compute_molecule_number_from_density(molecular_mass, volume, density) -> int
     return int(number)
 
 
+def convert_blmin_to_array(blmin: dict, fill_value: float = 0.0) -> np.ndarray:
+    """Convert a bond length minimum dict to a dense array.
+
+    Args:
+        blmin: A dict whose keys are pairs of atomic numbers.
+        fill_value: The value of pairs that are not in the dict.
+
+    Returns:
+        An array indexed by atomic numbers, `arr[i, j] == blmin[(i, j)]`.
+
+    """
+    pairs = np.array(list(blmin.keys()), dtype=np.int32).reshape(-1, 2)
+    distances = np.array(list(blmin.values()), dtype=np.float64)
+    num_types = pairs.max() + 1 if pairs.size > 0 else 0
+
+    arr = np.full((num_types, num_types), fill_value, dtype=np.float64)
+    arr[pairs[:, 0], pairs[:, 1]] = distances
+    arr[pairs[:, 1], pairs[:, 0]] = distances
+
+    return arr
+
+
 def check_overlap_neighbour(
     atoms: Atoms, covalent_ratio, custom_dmin_dict={}, excluded_pairs=[]
 ):
@@ -154,6 +154,9 @@ class AbstractDriver(AbstractNode):
     #: Atoms that is for state check.
     atoms: Optional[Atoms] = None
 
+    #: Trajectory cached by the last run to check convergence.
+    cache_traj: Optional[List[Atoms]] = None
+
     #: Whether check the dynamics is converged, and re-run if not.
     ignore_convergence: bool = False
 
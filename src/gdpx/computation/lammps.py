@@ -638,15 +638,19 @@ class LmpDriver(AbstractDriver):
         # curr_traj_frames = curr_traj_frames[:nframes]
         # assert len(pot_energies) == len(curr_traj_frames), f"Number of pot energies and frames are inconsistent at {str(wdir)}."
 
+        # NOTE: Map steps to their first thermo rows once instead of searching
+        #       the thermo steps for every dumped frame.
+        thermo_step_indices = {}
+        for i, t in enumerate(thermo_dict["Step"].tolist()):
+            thermo_step_indices.setdefault(t, i)
+
         curr_traj_frames, curr_energies = [], []
         for i, t in enumerate(timesteps):
-            if t in thermo_dict["Step"]:
+            if t in thermo_step_indices:
                 curr_atoms = curr_traj_frames_[i]
                 curr_atoms.info["step"] = t
                 curr_traj_frames.append(curr_atoms)
-                curr_energies.append(
-                    pot_energies[thermo_dict["Step"].tolist().index(t)]
-                )
+                curr_energies.append(pot_energies[thermo_step_indices[t]])
 
         for pot_eng, atoms in zip(curr_energies, curr_traj_frames):
             forces = atoms.get_forces()
@@ -663,10 +667,8 @@ class LmpDriver(AbstractDriver):
                 dkeys = [x.strip() for x in dkeys][1:]
             else:
                 ...
-            devi_io.seek(0)
-            data = np.loadtxt(devi_io, dtype=float)
-            ncols = data.shape[-1]
-            data = data.reshape(-1, ncols)
+            # NOTE: Parse the lines already read instead of the file again.
+            data = np.loadtxt(lines, dtype=float, ndmin=2)
             # NOTE: For some minimisers, dp gives several deviations as
             #       multiple force evluations are performed in one step.
             #       Thus, we only take the last occurance of the deviation in each step.
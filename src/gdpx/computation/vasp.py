@@ -337,9 +337,10 @@ class VaspDriver(AbstractDriver):
         if self.directory.exists():
             vasprun = self.directory / "vasprun.xml"
             if vasprun.exists() and vasprun.stat().st_size != 0:
-                temp_frames = read(vasprun, ":")
+                # NOTE: Only the first frame is needed to verify the outputs.
+                temp_atoms = read(vasprun, 0)
                 try:
-                    _ = temp_frames[0].get_forces()
+                    _ = temp_atoms.get_forces()
                 except:  # `RuntimeError: Atoms object has no calculator.`
                     verified = False
             else:
@@ -9,6 +9,8 @@ import warnings
 
 import numpy as np
 
+from joblib import Parallel, delayed
+
 from ase import Atoms
 from ase.io import read, write
 from ase.calculators.singlepoint import SinglePointCalculator
@@ -218,9 +220,17 @@ class XyzDataloader(AbstractDataloader):
                 self._print(f"  {curr_subsystem.relative_to(curr_system)}")
                 xyz_fpaths = list(curr_subsystem.glob("*.xyz"))
                 xyz_fpaths.sort()  # sort by alphabet
-                for p in xyz_fpaths:
-                    # read and split dataset
-                    p_frames = read(p, ":")
+                # read and split dataset
+                # NOTE: Files are read by threads as reading is often limited
+                #       by the (network) file system, and the results keep
+                #       the order of the files.
+                if self.njobs > 1 and len(xyz_fpaths) > 1:
+                    p_frames_list = Parallel(n_jobs=self.njobs, prefer="threads")(
+                        delayed(read)(p, ":") for p in xyz_fpaths
+                    )
+                else:
+                    p_frames_list = [read(p, ":") for p in xyz_fpaths]
+                for p, p_frames in zip(xyz_fpaths, p_frames_list):
                     p_nframes = len(p_frames)
                     frames.extend(p_frames)
                     self._print(f"    subsystem: {p.name} number {p_nframes}")
@@ -251,8 +261,11 @@ class XyzDataloader(AbstractDataloader):
                         np.floor(nframes * self.train_ratio / new_batchsize)
                         * new_batchsize
                     )
-                    train_index = self.rng.choice(nframes, ntrain, replace=False)
-                    test_index = [x for x in range(nframes) if x not in train_index]
+                    # NOTE: One shuffle gives both train and test indices
+                    #       without searching for the complement.
+                    perm_index = self.rng.permutation(nframes)
+                    train_index = perm_index[:ntrain]
+                    test_index = perm_index[ntrain:]
                 adjusted_batchsizes.append(new_batchsize)
 
             ntrain, ntest = len(train_index), len(test_index)
@@ -8,7 +8,7 @@ from .. import config
 from ..core.register import registers
 from ..data.array import AtomsNDArray
 from ..builder.builder import StructureBuilder
-from ..builder.utils import convert_string_to_atoms
+from ..builder.utils import convert_blmin_to_array, convert_string_to_atoms
 from ..worker.single import SingleWorker
 from ..worker.drive import DriverBasedWorker
 from ..worker.interface import ComputerVariable
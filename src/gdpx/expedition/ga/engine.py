@@ -13,16 +13,16 @@ import numpy as np
 import ase.formula
 
 from ase import Atoms
+from ase.db.sqlite import SQLite3Database, index_statements
 from ase.io import read, write
 from ase.ga.data import PrepareDB, DataConnection
-from ase.ga.population import Population
-from ase.ga.offspring_creator import OperationSelector
 
 from .population import AbstractPopulationManager
 
 from .. import registers
 from .. import convert_indices
 from ..expedition import AbstractExpedition
+from ...worker.drive import CommandDriverBasedWorker
 
 """
 TODO: search variational composition
@@ -139,6 +139,9 @@ class GeneticAlgorithemEngine(AbstractExpedition):
         # - misc
         self.use_archive = ga_dict.get("use_archive", True)
 
+        # - number of jobs to relax the initial population in parallel
+        self.init_njobs = ga_dict.get("init_njobs", 1)
+
         return
 
     @property
@@ -149,32 +152,94 @@ class GeneticAlgorithemEngine(AbstractExpedition):
     def directory(self, directory_):
         self._directory = pathlib.Path(directory_)
         self.db_path = self._directory / self.db_name
+        self.calc_path = self._directory / self.CALC_DIRNAME
+        self.results_path = self._directory / "results"
+        # NOTE: the cached connection points to the previous database
+        if hasattr(self, "da"):
+            del self.da
+        return
+
+    def _connect_database(self) -> DataConnection:
+        """Connect to the GA database and cache its metadata.
+
+        The connection is reused by later calls so the slab and the atom numbers
+        to optimise are only read from the database once.
+
+        """
+        if not hasattr(self, "da"):
+            self.da = DataConnection(self.db_path)
+            self._create_database_index()
+            self._slab = self.da.get_slab()
+            self._atom_numbers_to_optimize = self.da.get_atom_numbers_to_optimize()
+
+        return self.da
+
+    def _create_database_index(self):
+        """Index key-value pairs of the GA database.
+
+        Selections like `relaxed=0,generation=1` or `gaid=10` filter rows by
+        the values of number keys but ASE only indexes the key names, which
+        makes every selection scan all key-value pairs.
+
+        """
+        if isinstance(self.da.c, SQLite3Database):
+            with self.da.c.managed_connection() as con:
+                con.execute(
+                    "CREATE INDEX IF NOT EXISTS number_key_value_index "
+                    "ON number_key_values(key, value, id)"
+                )
+
         return
 
+    def _drop_database_index(self, database) -> List[str]:
+        """Drop indexes of an ASE database before a bulk insert.
+
+        Updating the indexes row by row slows down inserts, so they are
+        dropped and created once after all rows are written.
+
+        Returns:
+            Statements to recreate the dropped indexes.
+
+        """
+        statements = []
+        if isinstance(database, SQLite3Database):
+            # NOTE: Names are taken from ASE's schema, which may vary by version.
+            for statement in index_statements:
+                index_name = statement.split()[2]
+                database.connection.execute(f"DROP INDEX IF EXISTS {index_name}")
+                statements.append(statement)
+
+        return statements
+
     def report(self):
         self._print("restart the database...")
-        self.da = DataConnection(self.db_path)
-        results = self.directory / "results"
+        self._connect_database()
+        results = self.results_path
         if not results.exists():
             results.mkdir()
 
-        # - write structures
-        all_relaxed_candidates = self.da.get_all_relaxed_candidates()
-        write(results / "all_candidates.xyz", all_relaxed_candidates)
-
-        # - plot population evolution
-        data = []
         cur_gen_num = (
             self.da.get_generation_number()
         )  # equals finished generation plus one
         self._print(f"Current generation number: {cur_gen_num}")
-        for i in range(cur_gen_num):
-            # print('generation ', i)
-            energies = [
-                atoms.get_potential_energy()
-                for atoms in all_relaxed_candidates
-                if atoms.info["key_value_pairs"]["generation"] == i
-            ]
+
+        # - write structures and group energies by generation in one pass
+        #   NOTE: candidates are streamed to the file one by one
+        #         so that all of them need not be kept in memory
+        gen_energies = [[] for _ in range(cur_gen_num)]
+        with open(results / "all_candidates.xyz", "w") as fopen:
+            for row in self.da.c.select("relaxed=1", sort="-raw_score"):
+                atoms = self.da.get_atoms(id=row.id)
+                atoms.info["confid"] = row.gaid
+                atoms.info["relax_id"] = row.id
+                write(fopen, atoms, format="extxyz")
+                i = atoms.info["key_value_pairs"]["generation"]
+                if i < cur_gen_num:
+                    gen_energies[i].append(atoms.get_potential_energy())
+
+        # - plot population evolution
+        data = []
+        for i, energies in enumerate(gen_energies):
             self._print(energies)
             data.append([i, energies])
 
@@ -209,7 +274,7 @@ class GeneticAlgorithemEngine(AbstractExpedition):
         """
         # - outputs
         assert self.worker is not None, "GA has not set its worker properly."
-        self.worker.directory = self.directory / self.CALC_DIRNAME
+        self.worker.directory = self.calc_path
         self.pop_manager._print = self._print
 
         # - search target
@@ -222,8 +287,11 @@ class GeneticAlgorithemEngine(AbstractExpedition):
 
         # - generator info
         self._print("===== register builder =====")
-        for l in str(self.generator).split("\n"):
-            self._print(l)
+        # NOTE: The full builder info (e.g. the bond-length table) is only
+        #       printed when the search starts, restarts skip it.
+        if not self.db_path.exists():
+            for l in str(self.generator).split("\n"):
+                self._print(l)
         self._print(f"random_state: f{self.generator.random_seed}")
 
         # NOTE: check database existence and generation number to determine restart
@@ -233,7 +301,7 @@ class GeneticAlgorithemEngine(AbstractExpedition):
             self._create_initial_population()
         else:
             self._print("restart the database...")
-            self.da = DataConnection(self.db_path)
+            self._connect_database()
 
         # --- mutation and comparassion operators
         self._print("===== register operators =====")
@@ -258,23 +326,23 @@ class GeneticAlgorithemEngine(AbstractExpedition):
         # --- check current generation number
         self.cur_gen = self.da.get_generation_number()
         # output a few info
-        unrelaxed_strus_gen_ = list(
-            self.da.c.select("relaxed=0,generation=%d" % self.cur_gen)
-        )
-        unrelaxed_strus_gen = []
-        for row in unrelaxed_strus_gen_:
+        # NOTE: Only gaids are needed so rows are iterated without their data
+        #       instead of being materialised as lists.
+        self.unrelaxed_confids = []
+        for row in self.da.c.select(
+            "relaxed=0,generation=%d" % self.cur_gen, include_data=False
+        ):
             # NOTE: mark_as_queue unrelaxed_candidate will have relaxed field too...
             if "queued" not in row:
-                unrelaxed_strus_gen.append(row)
-        self.unrelaxed_confids = [row["gaid"] for row in unrelaxed_strus_gen]
+                self.unrelaxed_confids.append(row["gaid"])
         self.num_unrelaxed_gen = len(self.unrelaxed_confids)
 
-        relaxed_strus_gen = list(
-            self.da.c.select("relaxed=1,generation=%d" % self.cur_gen)
-        )
-        for row in relaxed_strus_gen:
+        self.relaxed_confids = []
+        for row in self.da.c.select(
+            "relaxed=1,generation=%d" % self.cur_gen, include_data=False
+        ):
             self._debug(row)
-        self.relaxed_confids = [row["gaid"] for row in relaxed_strus_gen]
+            self.relaxed_confids.append(row["gaid"])
         self.num_relaxed_gen = len(self.relaxed_confids)
 
         # check if this is the begin or the end of the current generation
@@ -293,6 +361,9 @@ class GeneticAlgorithemEngine(AbstractExpedition):
             raise RuntimeError(
                 "The current genertion is unknown. Check generation before."
             )
+        # - working directory of the current generation
+        gen_wdir = self.calc_path / f"{self.GEN_PREFIX}{self.cur_gen}"
+
         # - generation
         self._print("===== Generation Info =====")
         self._print(f"current generation number: {self.cur_gen}")
@@ -323,22 +394,20 @@ class GeneticAlgorithemEngine(AbstractExpedition):
         # - minimise
         if self.cur_gen == 0:
             self._print("===== Initial Population Calculation =====")
-            frames_to_work = []
-            while (
-                self.da.get_number_of_unrelaxed_candidates()
-            ):  # NOTE: this uses GADB get_atoms which adds extra_info
-                # calculate structures from init population
-                atoms = self.da.get_an_unrelaxed_candidate()
-                frames_to_work.append(atoms)
+            # NOTE: this uses GADB get_atoms which adds extra_info
+            #       fetch all unrelaxed candidates at once instead of polling
+            #       the database for the number of unrelaxed after each queue
+            frames_to_work = self.da.get_all_unrelaxed_candidates()
+            for atoms in frames_to_work:
                 self.da.mark_as_queued(atoms)  # this marks relaxation is in the queue
             confids = [a.info["confid"] for a in frames_to_work]
             self._print(f"start to run structure {convert_indices(confids)}")
             # NOTE: provide unified interface to mlp and dft
             if frames_to_work:
-                self.worker.directory = (
-                    self.directory / self.CALC_DIRNAME / f"gen{self.cur_gen}"
-                )
-                _ = self.worker.run(frames_to_work)  # retrieve later
+                self.worker.directory = gen_wdir
+                _ = self.worker.run(
+                    frames_to_work, n_jobs=self._get_init_njobs()
+                )  # retrieve later
         else:
             # --- update population
             self._print("===== Update Population =====")
@@ -354,6 +423,8 @@ class GeneticAlgorithemEngine(AbstractExpedition):
             # for a in candidate_groups["paired"]:
             #    print(a.info)
 
+            from ase.ga.population import Population
+
             # TODO: random seed...
             current_population = Population(
                 data_connection=self.da,
@@ -429,7 +500,7 @@ class GeneticAlgorithemEngine(AbstractExpedition):
             self._print("===== Optimisation =====")
             for ia, a in enumerate(current_candidates):
                 self._print(f"{ia} {a.info}")
-            if not (self.directory / self.CALC_DIRNAME / f"gen{self.cur_gen}").exists():
+            if not gen_wdir.exists():
                 frames_to_work = []
                 for atoms in current_candidates:
                     frames_to_work.append(atoms)
@@ -439,9 +510,7 @@ class GeneticAlgorithemEngine(AbstractExpedition):
                 if frames_to_work:
                     confids = [a.info["confid"] for a in frames_to_work]
                     self._print(f"start to run structure {convert_indices(confids)}")
-                    self.worker.directory = (
-                        self.directory / self.CALC_DIRNAME / f"gen{self.cur_gen}"
-                    )
+                    self.worker.directory = gen_wdir
                     _ = self.worker.run(frames_to_work)  # retrieve later
             else:
                 self._print(
@@ -450,9 +519,7 @@ class GeneticAlgorithemEngine(AbstractExpedition):
 
         # --- check if there were finished jobs
         curr_convergence = False
-        self.worker.directory = (
-            self.directory / self.CALC_DIRNAME / f"gen{self.cur_gen}"
-        )
+        self.worker.directory = gen_wdir
         self.worker.inspect(resubmit=True)
         if self.worker.get_number_of_running_jobs() == 0:
             self._print("===== Retrieve Relaxed Population =====")
@@ -499,10 +566,35 @@ class GeneticAlgorithemEngine(AbstractExpedition):
 
         return curr_convergence
 
+    def _get_init_njobs(self) -> int:
+        """Get the number of jobs to relax the initial population.
+
+        Only the ase driver run by a command worker relaxes structures in
+        parallel. Other drivers (vasp, lammps, cp2k...) launch their own
+        processes and the queue worker submits jobs to the scheduler.
+
+        """
+        init_njobs = self.init_njobs
+        if init_njobs > 1:
+            if not (
+                isinstance(self.worker, CommandDriverBasedWorker)
+                and self.worker.driver.name == "ase"
+            ):
+                self._print(
+                    f"init_njobs {init_njobs} is ignored as it only supports the ase driver run by command."
+                )
+                init_njobs = 1
+            else:
+                self._print(
+                    f"relax the initial population with {init_njobs} jobs in each batch."
+                )
+
+        return init_njobs
+
     def get_workers(self):
         """Get all workers used by this expedition."""
         if not hasattr(self, "da"):
-            self.da = DataConnection(self.db_path)
+            self._connect_database()
             self._check_generation()
 
         num_gen = self.cur_gen
@@ -515,9 +607,7 @@ class GeneticAlgorithemEngine(AbstractExpedition):
         workers = []
         for i in range(num_gen):
             curr_worker = copy.deepcopy(self.worker)
-            curr_worker.directory = (
-                self.directory / self.CALC_DIRNAME / (f"{self.GEN_PREFIX}{i}")
-            )
+            curr_worker.directory = self.calc_path / f"{self.GEN_PREFIX}{i}"
             workers.append(curr_worker)
 
         return workers
@@ -525,7 +615,7 @@ class GeneticAlgorithemEngine(AbstractExpedition):
     def read_convergence(self):
         """check whether the search is converged"""
         if not hasattr(self, "cur_gen"):
-            self.da = DataConnection(self.db_path)
+            self._connect_database()
             self._check_generation()
         max_gen = self.conv_dict["generation"]
         if self.cur_gen > max_gen and (self.num_relaxed_gen == self.num_unrelaxed_gen):
@@ -568,14 +658,14 @@ class GeneticAlgorithemEngine(AbstractExpedition):
             }
 
         specific_params = dict(
-            slab=self.da.get_slab(),
-            n_top=len(self.da.get_atom_numbers_to_optimize()),
+            slab=self._slab,
+            n_top=len(self._atom_numbers_to_optimize),
             blmin=self.generator.blmin,
             number_of_variable_cell_vectors=self.generator.number_of_variable_cell_vectors,
             cell_bounds=self.generator.cell_bounds,
             test_dist_to_slab=self.generator.test_dist_to_slab,
             use_tags=self.generator.use_tags,
-            used_modes_file=self.directory / self.CALC_DIRNAME / "used_modes.json",
+            used_modes_file=self.calc_path / "used_modes.json",
             # rng = self.rng # TODO: ase operators need np.random
         )
 
@@ -615,6 +705,8 @@ class GeneticAlgorithemEngine(AbstractExpedition):
         # self._print(f"mutation probability: {self.pmut}")
         for mut, prob in zip(mutations, probs):
             self._print(f"Use mutation {mut.descriptor} with prob {prob}.")
+        from ase.ga.offspring_creator import OperationSelector
+
         self.mutations = OperationSelector(probs, mutations, rng=np.random)
 
         return
@@ -634,22 +726,32 @@ class GeneticAlgorithemEngine(AbstractExpedition):
             generator=self.generator
         )
 
+        # NOTE: All rows are written in one transaction that commits once
+        #       instead of committing after every insert.
         self._print(f"save population {len(starting_population)} to database")
-        for a in starting_population:
-            da.add_unrelaxed_candidate(a)
-
-        # TODO: change this to the DB interface
-        self._print(
-            "save population size {0} into database...".format(
-                self.pop_manager.gen_size
+        with da.c:
+            dropped_index_statements = self._drop_database_index(da.c)
+            # NOTE: Candidates are popped in the original order so each one
+            #       can be freed once it is written.
+            starting_population.reverse()
+            while starting_population:
+                da.add_unrelaxed_candidate(starting_population.pop())
+
+            # TODO: change this to the DB interface
+            self._print(
+                "save population size {0} into database...".format(
+                    self.pop_manager.gen_size
+                )
             )
-        )
-        row = da.c.get(1)
-        new_data = row["data"].copy()
-        new_data["population_size"] = self.pop_manager.gen_size
-        da.c.update(1, data=new_data)
+            row = da.c.get(1)
+            new_data = row["data"].copy()
+            new_data["population_size"] = self.pop_manager.gen_size
+            da.c.update(1, data=new_data)
+
+            for statement in dropped_index_statements:
+                da.c.connection.execute(statement)
 
-        self.da = DataConnection(self.db_path)
+        self._connect_database()
 
         return
 
@@ -11,7 +11,6 @@ import numpy as np
 from ase import Atoms
 from ase.calculators.singlepoint import SinglePointCalculator
 from ase.io import read, write
-from ase.ga.population import Population
 from ase.ga.data import DataConnection
 
 #: Retained keys in key_value_pairs when get_atoms from the database.
@@ -149,15 +148,16 @@ class AbstractPopulationManager:
         num_paired, num_mutated, num_random = 0, 0, 0
 
         # unrelaxed_strus_gen_ = list(database.c.select(f"relaxed=0"))
-        unrelaxed_strus_gen_ = list(
-            database.c.select(f"relaxed=0,generation={curr_gen}")
+        unrelaxed_strus_gen_ = database.c.select(
+            f"relaxed=0,generation={curr_gen}", include_data=False
         )
         for row in unrelaxed_strus_gen_:
             if row.formula:
                 # print(row["gaid"], row)
                 confid = row["gaid"]
                 curr_rows = sorted(
-                    database.c.select(f"relaxed=0,gaid={confid}"), key=lambda x: x.mtime
+                    database.c.select(f"relaxed=0,gaid={confid}", include_data=False),
+                    key=lambda x: x.mtime,
                 )
                 curr_rows = [x for x in curr_rows if x.formula]
                 # - get atoms
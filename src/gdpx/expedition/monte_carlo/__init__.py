@@ -3,7 +3,7 @@
 
 
 from .. import registers
-from .. import convert_string_to_atoms
+from .. import convert_blmin_to_array, convert_string_to_atoms
 
 
 if __name__ == "__main__":
@@ -10,7 +10,81 @@ import numpy as np
 from ase import Atoms
 from ase import data, units
 
-from .. import registers
+from .. import registers, convert_blmin_to_array
+
+
+class SpeciesNeighbourList:
+    """A neighbour list that only searches neighbours of the queried atoms.
+
+    It follows the interface of `ase.neighborlist.NeighborList` with
+    `skin=0.0`, `self_interaction=False` and `bothways=True`. Instead of binning
+    the whole system in every update, neighbours of an atom are found by
+    one vectorised distance calculation against all atoms and their periodic
+    images, which is much cheaper when only a few species are moved in a
+    Monte Carlo attempt.
+
+    """
+
+    def __init__(self, cutoffs) -> None:
+        """"""
+        self.cutoffs = np.array(cutoffs)
+
+        return
+
+    #: Cell used to find the periodic images.
+    cell: np.ndarray = None
+
+    #: Periodic boundary conditions used to find the periodic images.
+    pbc: np.ndarray = None
+
+    def update(self, atoms: Atoms) -> bool:
+        """"""
+        self.positions = atoms.positions
+
+        # - images only depend on the cell, which does not change in most moves
+        cell = atoms.get_cell(complete=True).array
+        if (
+            self.cell is not None
+            and np.array_equal(cell, self.cell)
+            and np.array_equal(atoms.pbc, self.pbc)
+        ):
+            return True
+        self.cell = cell
+        self.pbc = atoms.pbc.copy()
+
+        rmax = 2.0 * np.max(self.cutoffs)
+        # NOTE: The distance between opposite faces of the cell is the inverse
+        #       of the norm of the corresponding reciprocal vector.
+        face_dist = 1.0 / np.linalg.norm(np.linalg.inv(self.cell).T, axis=1)
+        nimages = np.where(self.pbc, np.ceil(rmax / face_dist), 0).astype(int)
+        self.images = np.array(
+            np.meshgrid(*[np.arange(-n, n + 1) for n in nimages], indexing="ij")
+        ).reshape(3, -1).T
+
+        return True
+
+    def get_neighbors(self, a: int):
+        """Return indices and offsets of the neighbours of atom `a`."""
+        # - shift all atoms to the image closest to atom `a`
+        vectors = self.positions - self.positions[a]
+        shifts = np.zeros(vectors.shape, dtype=int)
+        shifts[:, self.pbc] = -np.round(
+            np.linalg.solve(self.cell.T, vectors.T).T[:, self.pbc]
+        ).astype(int)
+        vectors += shifts @ self.cell
+
+        # - search over neighbouring images, shape (nimages, natoms, 3)
+        vectors = vectors[np.newaxis, :, :] + (self.images @ self.cell)[:, np.newaxis, :]
+        distances = np.linalg.norm(vectors, axis=2)
+
+        mask = distances < self.cutoffs + self.cutoffs[a]
+        # -- exclude the atom itself but keep its periodic images
+        mask[np.all(self.images == 0, axis=1), a] = False
+
+        image_indices, indices = np.nonzero(mask)
+        offsets = shifts[indices] + self.images[image_indices]
+
+        return indices, offsets
 
 
 class AbstractOperator(abc.ABC):
@@ -24,6 +98,12 @@ class AbstractOperator(abc.ABC):
     #: Print function.
     _print: Callable = print
 
+    #: Minimum bond lengths keyed by pairs of atomic numbers.
+    _blmin: dict = None
+
+    #: Minimum bond lengths indexed by atomic numbers.
+    _blmin_table: np.ndarray = None
+
     def __init__(
         self,
         region: dict = {},
@@ -72,6 +152,43 @@ class AbstractOperator(abc.ABC):
 
         return
 
+    @property
+    def blmin(self) -> dict:
+        """Minimum bond lengths keyed by pairs of atomic numbers.
+
+        A dense table is cached when it is set, which is used by the overlap
+        check instead of looking up the dict pair by pair. Pairs that are not
+        in the dict are NaN in the table and raise a KeyError when looked up.
+
+        """
+
+        return self._blmin
+
+    @blmin.setter
+    def blmin(self, blmin: dict):
+        self._blmin = blmin
+        if blmin is not None:
+            self._blmin_table = convert_blmin_to_array(blmin, fill_value=np.nan)
+        else:
+            self._blmin_table = None
+
+        return
+
+    def _get_blmin(self, numbers: np.ndarray, number: int) -> np.ndarray:
+        """Get minimum bond lengths between atoms of `numbers` and `number`."""
+        table = self._blmin_table
+        num_types = table.shape[0]
+        dismin = np.full(numbers.shape, np.nan)
+        if number < num_types:
+            is_stored = numbers < num_types
+            dismin[is_stored] = table[numbers[is_stored], number]
+        is_missing = np.isnan(dismin)
+        if np.any(is_missing):
+            pairs = sorted(set((int(n), int(number)) for n in numbers[is_missing]))
+            raise KeyError(f"Bond length minimum of pairs {pairs} is not set.")
+
+        return dismin
+
     def _check_region(self, atoms: Atoms, *args, **kwargs):
         """"""
         if self.region.__class__.__name__ == "AutoRegion":
@@ -156,41 +273,47 @@ class AbstractOperator(abc.ABC):
         # -
         num_atoms_in_species = len(species_indices)
 
-        species_status = ["valid"] * num_atoms_in_species
+        species_status = ["unchecked"] * num_atoms_in_species
         self._print(f"- {species_indices =}")
 
-        # - get symbols here since some operators may change the symbol
-        chemical_symbols = new_atoms.get_chemical_symbols()
+        # - get numbers here since some operators may change the symbol
+        atomic_numbers = new_atoms.numbers
+        positions = new_atoms.positions
 
         nl.update(new_atoms)
         for iatom, idx_pick in enumerate(species_indices):
             indices, offsets = nl.get_neighbors(idx_pick)
             self._debug(
-                f"  check index {idx_pick} {new_atoms.positions[idx_pick]} nneighs: {len(indices)}"
+                f"  check index {idx_pick} {positions[idx_pick]} nneighs: {len(indices)}"
             )
             if len(indices) > 0:
                 # --
-                if all([(ni in species_indices) for ni in indices]):
+                is_other = ~np.isin(indices, species_indices)
+                if not np.any(is_other):
                     species_status[iatom] = "isolated"
                     continue
                 # -- check inter-species atomic distances
-                for ni, offset in zip(indices, offsets):
-                    # NOTE: Check if the species contact other atoms
-                    #       in a reasonable distance.
-                    #       Intra-species distance will not be checked.
-                    if ni not in species_indices:
-                        dis = np.linalg.norm(
-                            new_atoms.positions[idx_pick]
-                            - (new_atoms.positions[ni] + np.dot(offset, cell))
-                        )
-                        pairs = [chemical_symbols[ni], chemical_symbols[idx_pick]]
-                        pairs = tuple([data.atomic_numbers[p] for p in pairs])
-                        if dis <= self.blmin[pairs]:
-                            species_status[iatom] = "invalid"
-                            self._debug(f"  distance: {ni} {dis} {self.blmin[pairs]}")
-                            break
-                    else:
-                        ...
+                #    NOTE: Check if the species contact other atoms
+                #          in a reasonable distance.
+                #          Intra-species distance will not be checked.
+                indices, offsets = indices[is_other], offsets[is_other]
+                distances = np.linalg.norm(
+                    positions[idx_pick] - (positions[indices] + np.dot(offsets, cell)),
+                    axis=1,
+                )
+                dismin = self._get_blmin(
+                    atomic_numbers[indices], atomic_numbers[idx_pick]
+                )
+                is_invalid = distances <= dismin
+                if np.any(is_invalid):
+                    species_status[iatom] = "invalid"
+                    ni = np.argmax(is_invalid)
+                    self._debug(
+                        f"  distance: {indices[ni]} {distances[ni]} {dismin[ni]}"
+                    )
+                    # NOTE: One invalid atom invalidates the whole species,
+                    #       so the rest atoms are not checked.
+                    break
                 else:
                     species_status[iatom] = "valid"
             else:
@@ -204,7 +327,7 @@ class AbstractOperator(abc.ABC):
 
         status_ = []
         for s in species_status:
-            if s == "valid" or s == "invalid":
+            if s == "valid" or s == "invalid" or s == "unchecked":
                 ...
             else:  # isolated
                 if self.allow_isolated:
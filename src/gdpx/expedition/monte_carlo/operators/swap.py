@@ -1,22 +1,28 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-import copy
 from typing import List
 
 import numpy as np
 
 from ase import Atoms
 from ase import data, units
-from ase.neighborlist import NeighborList, natural_cutoffs
+from ase.neighborlist import natural_cutoffs
 
 from .move import MoveOperator
+from .operator import SpeciesNeighbourList
 
 
 class SwapOperator(MoveOperator):
 
     name: str = "swap"
 
+    #: Atomic numbers of the system that the cached neighbour list is built for.
+    _nl_numbers: tuple = None
+
+    #: Cached neighbour list.
+    _nl: SpeciesNeighbourList = None
+
     def __init__(
         self,
         particles: List[str],
@@ -52,22 +58,19 @@ class SwapOperator(MoveOperator):
         super().run(atoms)
 
         # - basic
-        curr_atoms = atoms
-        cell = curr_atoms.get_cell(complete=True)
+        #   NOTE: Swap only changes positions so we work on one copy and
+        #         restore its positions if an attempt fails.
+        curr_atoms = atoms.copy()
+        saved_positions = curr_atoms.get_positions()
+        cell = curr_atoms.get_cell(complete=True).array
 
         # -- neighbour list
-        nl = NeighborList(
-            self.covalent_max * np.array(natural_cutoffs(curr_atoms)),
-            skin=0.0,
-            self_interaction=False,
-            bothways=True,
-        )
+        #    only neighbours of the swapped species are searched in each attempt
+        #    and cutoffs are reused as long as the composition does not change
+        nl = self._get_neighbour_list(curr_atoms)
 
         # - swap the species
         for i in range(self.MAX_RANDOM_ATTEMPTS):
-            # -- swap
-            curr_atoms = atoms.copy()
-
             # -- pick an atom
             #   either index of an atom or tag of an moiety
             first_pick = self._select_species(curr_atoms, [self.particles[0]], rng=rng)
@@ -78,10 +81,8 @@ class SwapOperator(MoveOperator):
             first_species = curr_atoms[first_pick]  # default copy
             second_species = curr_atoms[second_pick]
             # TODO: deal with pbc
-            first_cop = np.average(copy.deepcopy(first_species.get_positions()), axis=0)
-            second_cop = np.average(
-                copy.deepcopy(second_species.get_positions()), axis=0
-            )
+            first_cop = first_species.get_positions().mean(axis=0)
+            second_cop = second_species.get_positions().mean(axis=0)
 
             self._print(f"origin: {first_species.symbols} {first_cop}")
             self._print(f"origin: {second_species.symbols} {second_cop}")
@@ -90,32 +91,38 @@ class SwapOperator(MoveOperator):
             first_species = self._rotate_species(first_species, rng=rng)
             second_species = self._rotate_species(second_species, rng=rng)
 
-            curr_atoms.positions[first_pick] += second_cop - first_cop
-            curr_atoms.positions[second_pick] += first_cop - second_cop
-
-            first_species = curr_atoms[first_pick]
-            second_species = curr_atoms[second_pick]
-            # TODO: deal with pbc
-            first_cop = np.average(copy.deepcopy(first_species.get_positions()), axis=0)
-            second_cop = np.average(
-                copy.deepcopy(second_species.get_positions()), axis=0
+            #    NOTE: Two species are disjoint so both can be shifted at once.
+            idx_pick = first_pick + second_pick
+            shift = second_cop - first_cop
+            curr_atoms.positions[idx_pick] += np.repeat(
+                [shift, -shift], [len(first_pick), len(second_pick)], axis=0
             )
 
-            self._print(f"swapped: {first_species.symbols} {first_cop}")
-            self._print(f"swapped: {second_species.symbols} {second_cop}")
+            # -- centres are exchanged by the shift
+            self._print(f"swapped: {first_species.symbols} {second_cop}")
+            self._print(f"swapped: {second_species.symbols} {first_cop}")
 
             # -- use neighbour list
-            idx_pick = []
-            idx_pick.extend(first_pick)
-            idx_pick.extend(second_pick)
             if not self.check_overlap_neighbour(nl, curr_atoms, cell, idx_pick):
                 self._print(f"succeed to random after {i+1} attempts...")
                 break
+            curr_atoms.positions[:] = saved_positions
         else:
             curr_atoms = None
 
         return curr_atoms
 
+    def _get_neighbour_list(self, atoms: Atoms) -> SpeciesNeighbourList:
+        """"""
+        numbers = tuple(atoms.numbers)
+        if self._nl is None or numbers != self._nl_numbers:
+            self._nl = SpeciesNeighbourList(
+                self.covalent_max * np.array(natural_cutoffs(atoms))
+            )
+            self._nl_numbers = numbers
+
+        return self._nl
+
     def as_dict(self) -> dict:
         """"""
         params = super().as_dict()
@@ -15,10 +15,31 @@ from .core.register import registers, import_all_modules_for_register
 from .utils.command import parse_input_file, dict2str
 
 
-def main():
-    # - register
-    import_all_modules_for_register()
+class RegisterHelpFormatter(argparse.RawDescriptionHelpFormatter):
+    """Help formatter that accepts a callable description.
+
+    The description is only created when the help is printed, which avoids
+    importing all registered modules just to build the parser.
+
+    """
+
+    def add_text(self, text):
+        if callable(text):
+            text = text()
+        return super().add_text(text)
+
+
+def describe_registers(*names: str):
+    """Create a callable that describes the given registers."""
 
+    def _describe() -> str:
+        import_all_modules_for_register()
+        return "\n".join([str(getattr(registers, name)) for name in names])
+
+    return _describe
+
+
+def main():
     description = "gdpx: Generating Deep Potential with Python\n"
 
     # - arguments
@@ -59,8 +80,8 @@ def main():
     parser_session = subparsers.add_parser(
         "session",
         help="run gdpy session",
-        description=str(registers.variable) + "\n" + str(registers.operation),
-        formatter_class=argparse.RawDescriptionHelpFormatter,
+        description=describe_registers("variable", "operation"),
+        formatter_class=RegisterHelpFormatter,
     )
     parser_session.add_argument(
         "SESSION", help="session configuration file (json/yaml)"
@@ -79,8 +100,8 @@ def main():
     parser_build = subparsers.add_parser(
         "build",
         help="build structures",
-        description=str(registers.builder),
-        formatter_class=argparse.RawDescriptionHelpFormatter,
+        description=describe_registers("builder"),
+        formatter_class=RegisterHelpFormatter,
     )
     parser_build.add_argument("CONFIG", help="builder configuration file (json/yaml)")
     parser_build.add_argument(
@@ -104,8 +125,8 @@ def main():
     parser_train = subparsers.add_parser(
         "train",
         help="automatic training utilities",
-        description=str(registers.trainer) + "\n" + str(registers.dataloader),
-        formatter_class=argparse.RawDescriptionHelpFormatter,
+        description=describe_registers("trainer", "dataloader"),
+        formatter_class=RegisterHelpFormatter,
     )
     parser_train.add_argument("CONFIG", help="training configuration file (json/yaml)")
 
@@ -113,8 +134,8 @@ def main():
     parser_compute = subparsers.add_parser(
         "compute",
         help="compute structures with basic methods (MD, MIN, and ...)",
-        description=str(registers.manager),
-        formatter_class=argparse.RawDescriptionHelpFormatter,
+        description=describe_registers("manager"),
+        formatter_class=RegisterHelpFormatter,
     )
     parser_compute.add_argument(
         "STRUCTURE",
@@ -143,8 +164,8 @@ def main():
     parser_explore = subparsers.add_parser(
         "explore",
         help="explore structures with advanced methods (GA, MC, and ...)",
-        description=str(registers.expedition),
-        formatter_class=argparse.RawDescriptionHelpFormatter,
+        description=describe_registers("expedition"),
+        formatter_class=RegisterHelpFormatter,
     )
     parser_explore.add_argument(
         "CONFIG", help="json/yaml file that stores parameters for a task"
@@ -157,8 +178,8 @@ def main():
     parser_select = subparsers.add_parser(
         "select",
         help="apply various selection operations",
-        description=str(registers.selector),
-        formatter_class=argparse.RawDescriptionHelpFormatter,
+        description=describe_registers("selector"),
+        formatter_class=RegisterHelpFormatter,
     )
     parser_select.add_argument("CONFIG", help="selection configuration file")
     parser_select.add_argument(
@@ -169,14 +190,20 @@ def main():
     parser_validation = subparsers.add_parser(
         "valid",
         help="validate properties with trained models",
-        description=str(registers.validator),
-        formatter_class=argparse.RawDescriptionHelpFormatter,
+        description=describe_registers("validator"),
+        formatter_class=RegisterHelpFormatter,
     )
     parser_validation.add_argument("CONFIG", help="validation configuration file")
 
     # === execute
     args = parser.parse_args()
 
+    # - register
+    #   NOTE: Importing all modules dominates the cost of short commands,
+    #         so skip it when no registered component is used.
+    if args.subcommand not in (None, "convert") or args.potential:
+        import_all_modules_for_register()
+
     # - update global configuration
     if args.debug:
         config.logger.setLevel(logging.DEBUG)
@@ -3,15 +3,16 @@
 
 
 import collections
-import copy
 import pathlib
 
 from typing import Union, List, Callable
 
 import numpy as np
 
+from joblib import Parallel, delayed
+
 from ase import Atoms
-from ase.io import read, write
+from ase import data
 
 try:
     import dpdata
@@ -29,6 +30,87 @@ def get_formula_from_atoms(atoms: Atoms) -> str:
     return "".join([str(k) + str(v) for k, v in sorted_composition])
 
 
+def convert_frames_to_system(
+    frames: List[Atoms], type_map: List[str], pbc: bool = True
+) -> "dpdata.LabeledSystem":
+    """Convert frames with the same composition to a labelled dpdata system.
+
+    Energies and forces are read from the results of the attached calculators
+    without copying them through `get_forces`, and virials are added only if
+    all frames store them in their info.
+
+    """
+    # - check labels as they are read from the calculators directly
+    for i, a in enumerate(frames):
+        results = a.calc.results if a.calc is not None else {}
+        if "energy" not in results or "forces" not in results:
+            raise ValueError(
+                f"Frame {i} {a.get_chemical_formula()} has no energy or forces."
+            )
+
+    # - sort atoms by types as frames may have different atom orders
+    type_indices = np.full(len(data.chemical_symbols), -1, dtype=int)
+    for i, s in enumerate(type_map):
+        type_indices[data.atomic_numbers[s]] = i
+    if np.any(type_indices[frames[0].numbers] < 0):
+        raise ValueError(
+            f"{frames[0].get_chemical_formula()} has elements not in {type_map}."
+        )
+    sorted_indices = [np.argsort(type_indices[a.numbers], kind="stable") for a in frames]
+
+    atom_types = type_indices[frames[0].numbers[sorted_indices[0]]]
+    atom_numbs = [int(np.sum(atom_types == i)) for i in range(len(type_map))]
+
+    system_data = dict(
+        atom_names=list(type_map),
+        atom_numbs=atom_numbs,
+        atom_types=atom_types,
+        orig=np.zeros(3),
+        cells=np.array([a.get_cell(complete=True).array for a in frames]),
+        coords=np.array(
+            [a.get_positions()[i] for a, i in zip(frames, sorted_indices)]
+        ),
+        energies=np.array([a.calc.results["energy"] for a in frames]),
+        forces=np.array(
+            [a.calc.results["forces"][i] for a, i in zip(frames, sorted_indices)]
+        ),
+        nopbc=not pbc,
+    )
+    if all(["virial" in a.info for a in frames]):
+        system_data["virials"] = np.array(
+            [np.reshape(a.info["virial"], (3, 3)) for a in frames]
+        )
+
+    return dpdata.LabeledSystem(data=system_data)
+
+
+def convert_group(
+    name: str, frames: List[Atoms], type_map: List[str], sys_dir: pathlib.Path
+) -> pathlib.Path:
+    """Dump one group of structures with the same composition to a system dir."""
+    # --- check composition consistent
+    #     NOTE: compare sorted atomic numbers instead of building
+    #           a formula string for every frame
+    sorted_numbers = np.sort(frames[0].numbers)
+    assert all(
+        [np.array_equal(np.sort(a.numbers), sorted_numbers) for a in frames[1:]]
+    ), f"Inconsistent composition in system {name}..."
+
+    # check pbc
+    pbc = all(a.pbc.all() for a in frames)
+
+    # --- convert data
+    #     NOTE: this creates the system from arrays directly instead of
+    #           writing frames to xyz and parsing them back with dpdata
+    dsys = convert_frames_to_system(frames, type_map, pbc)
+    dsys.to_deepmd_npy(sys_dir)  # prec, set_size
+    if not pbc:
+        with open(sys_dir / "nopbc", "w") as fopen:
+            fopen.write("nopbc\n")
+
+    return sys_dir
+
+
 def convert_groups(
     names: List[str],
     groups: List[List[Atoms]],
@@ -37,8 +119,14 @@ def convert_groups(
     suffix: str,
     dest_dir: Union[str, pathlib.Path] = "./",
     pfunc: Callable = print,
+    n_jobs: int = 1,
 ) -> None:
-    """Dump structures to dp trainning format."""
+    """Dump structures to dp trainning format.
+
+    Groups are independent so they are converted by parallel jobs if
+    `n_jobs` is larger than one.
+
+    """
 
     nsystems = len(groups)
     if isinstance(batchsizes, int):
@@ -47,8 +135,7 @@ def convert_groups(
     # --- dpdata conversion
     dest_dir = pathlib.Path(dest_dir)
     train_set_dir = dest_dir / f"{suffix}"
-    if not train_set_dir.exists():
-        train_set_dir.mkdir()
+    train_set_dir.mkdir(parents=True, exist_ok=True)
 
     sys_dirs = []
 
@@ -59,63 +146,22 @@ def convert_groups(
         pfunc(
             f"{suffix} system {name} nframes {nframes} nbatch {nbatch} batchsize {batchsize}"
         )
-        # --- check composition consistent
-        compositions = [get_formula_from_atoms(a) for a in frames]
-        assert (
-            len(set(compositions)) == 1
-        ), f"Inconsistent composition {len(set(compositions))} =? 1..."
-        curr_composition = compositions[0]
-
         cum_batchsizes += nbatch
-        # --- NOTE: need convert forces to force
-        frames_ = copy.deepcopy(frames)
-        # check pbc
-        pbc = np.all([np.all(a.get_pbc()) for a in frames_])
-        for atoms in frames_:
-            try:
-                # NOTE: We need update info and arrays as well
-                #       as some dpdata uses data from them instead of calculator
-                results = atoms.calc.results
-                for k, v in results.items():
-                    if k in atoms.info:
-                        atoms.info[k] = v
-                    if k in atoms.arrays:
-                        atoms.arrays[k] = v
-                # - change force data
-                forces = results["forces"].copy()
-                del atoms.arrays["forces"]
-                atoms.arrays["force"] = forces
-                # - remove some keys as dpdata cannot recognise them
-                #   e.g. tags, momenta, initial_charges
-                keys = copy.deepcopy(list(atoms.arrays.keys()))
-                for k in keys:
-                    if k not in ["numbers", "positions", "force"]:
-                        del atoms.arrays[k]
-            except:
-                ...
-            finally:
-                atoms.calc = None
-
-        # --- convert data
-        write(train_set_dir / f"{name}-{suffix}.xyz", frames_)
-        dsys = dpdata.MultiSystems.from_file(
-            train_set_dir / f"{name}-{suffix}.xyz",
-            fmt="quip/gap/xyz",
-            type_map=type_map,
-        )
-        # NOTE: this function create dir with composition and overwrite files
-        #       so we need separate dirs...
+
+        # NOTE: check all dirs before any conversion starts
         sys_dir = train_set_dir / name
         if sys_dir.exists():
             raise FileExistsError(f"{sys_dir} exists. Please check the dataset.")
-        else:
-            dsys.to_deepmd_npy(train_set_dir / "_temp")  # prec, set_size
-            (train_set_dir / "_temp" / curr_composition).rename(sys_dir)
-            if not pbc:
-                with open(sys_dir / "nopbc", "w") as fopen:
-                    fopen.write("nopbc\n")
         sys_dirs.append(sys_dir)
-    (train_set_dir / "_temp").rmdir()
+
+    if n_jobs > 1 and nsystems > 1:
+        sys_dirs = Parallel(n_jobs=min(n_jobs, nsystems), backend="loky")(
+            delayed(convert_group)(name, frames, type_map, sys_dir)
+            for name, frames, sys_dir in zip(names, groups, sys_dirs)
+        )
+    else:
+        for name, frames, sys_dir in zip(names, groups, sys_dirs):
+            convert_group(name, frames, type_map, sys_dir)
 
     return cum_batchsizes, sys_dirs
 
@@ -347,6 +347,7 @@ class DeepmdTrainer(AbstractTrainer):
                 "train",
                 train_dir,
                 self._print,
+                n_jobs=self.njobs,
             )
             _, valid_sys_dirs = convert_groups(
                 set_names,
@@ -356,6 +357,7 @@ class DeepmdTrainer(AbstractTrainer):
                 "valid",
                 train_dir,
                 self._print,
+                n_jobs=self.njobs,
             )
             self._print(f"accumulated number of batches: {cum_batchsizes}")
 
@@ -377,14 +379,17 @@ class DeepmdTrainer(AbstractTrainer):
         #       numb_steps, seed
         #       descriptor-seed, fitting_net-seed
         #       training - training_data, validation_data
-        train_config = copy.deepcopy(self.config)
-
-        train_config["model"]["descriptor"]["seed"] = self.rng.integers(
-            0, 10000, dtype=int
-        )
-        train_config["model"]["fitting_net"]["seed"] = self.rng.integers(
-            0, 10000, dtype=int
-        )
+        #       NOTE: The config is a plain json tree so a json round trip
+        #             copies it much faster than copy.deepcopy.
+        train_config = json.loads(json.dumps(self.config))
+
+        #       NOTE: Seeds are drawn at once, which gives the same values
+        #             as drawing them one by one.
+        descriptor_seed, fitting_seed, training_seed = self.rng.integers(
+            0, 10000, size=3, dtype=int
+        ).tolist()
+        train_config["model"]["descriptor"]["seed"] = descriptor_seed
+        train_config["model"]["fitting_net"]["seed"] = fitting_seed
 
         train_config["training"]["training_data"]["systems"] = [
             x for x in dataset.train_sys_dirs
@@ -396,7 +401,7 @@ class DeepmdTrainer(AbstractTrainer):
         ]
         train_config["training"]["validation_data"]["batch_size"] = dataset.batchsizes
 
-        train_config["training"]["seed"] = self.rng.integers(0, 10000, dtype=int)
+        train_config["training"]["seed"] = training_seed
 
         # --- calc numb_steps
         min_freq_unit = 100.0
@@ -477,10 +482,17 @@ class DeepmdTrainer(AbstractTrainer):
             # - get current step
             lcurve_out = self.directory / f"lcurve.out"
             if lcurve_out.exists():
-                with open(lcurve_out, "r") as fopen:
-                    lines = fopen.readlines()
+                # NOTE: Only read the last line as `lcurve.out` can be large.
+                with open(lcurve_out, "rb") as fopen:
+                    try:  # catch OSError in case of a one line file
+                        fopen.seek(-2, os.SEEK_END)
+                        while fopen.read(1) != b"\n":
+                            fopen.seek(-2, os.SEEK_CUR)
+                    except OSError:
+                        fopen.seek(0)
+                    line = fopen.readline().decode()
                 try:
-                    curr_steps = int(lines[-1].strip().split()[0])
+                    curr_steps = int(line.strip().split()[0])
                     if curr_steps >= numb_steps:
                         converged = True
                     self._debug(f"{curr_steps} >=? {numb_steps}")
@@ -512,6 +524,8 @@ class DeepmdManager(AbstractPotentialManager):
 
     def __init__(self, *args, **kwargs):
         """"""
+        #: ASE calculators keyed by the model path and the type map.
+        self._dp_calcs = {}
 
         return
 
@@ -529,9 +543,7 @@ class DeepmdManager(AbstractPotentialManager):
         directory = calc_params.pop("directory", pathlib.Path.cwd())
 
         type_list = calc_params.pop("type_list", [])
-        type_map = {}
-        for i, a in enumerate(type_list):
-            type_map[a] = i
+        type_map = {a: i for i, a in enumerate(type_list)}
 
         # --- model files
         model_ = calc_params.get("model", [])
@@ -562,9 +574,15 @@ class DeepmdManager(AbstractPotentialManager):
                 )
             # if models and type_map:
             #    calc = DP(model=models[0], type_dict=type_map)
+            # NOTE: Reuse calculators of the same models so the loaded models
+            #       are kept, for example, when the uncertainty estimation
+            #       is switched on and the committee is recreated.
             calcs = []
             for m in models:
-                curr_calc = DP(model=m, type_dict=type_map)
+                calc_key = (m, tuple(type_map.items()))
+                if calc_key not in self._dp_calcs:
+                    self._dp_calcs[calc_key] = DP(model=m, type_dict=type_map)
+                curr_calc = self._dp_calcs[calc_key]
                 calcs.append(curr_calc)
             if len(calcs) == 1:
                 calc = calcs[0]
@@ -712,6 +730,8 @@ class DeepmdManager(AbstractPotentialManager):
                 self.calc.dp = None
         else:
             ...
+        for c in self._dp_calcs.values():
+            c.dp = None
 
         return
 
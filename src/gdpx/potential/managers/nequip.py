@@ -2,15 +2,23 @@
 # -*- coding: utf-8 -*
 
 import copy
+import io
+import itertools
 import os
 import pathlib
-from typing import List
+from typing import List, Tuple
 import warnings
 
 import yaml
+try:
+    from yaml import CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeDumper
 
 import numpy as np
 
+from joblib import Parallel, delayed
+
 from ase.io import read, write
 from ase.calculators.calculator import Calculator
 
@@ -18,6 +26,156 @@ from . import AbstractPotentialManager, AbstractTrainer
 from . import DummyCalculator, CommitteeCalculator
 
 
+#: Buffer size in bytes to write the training dataset.
+DATASET_BUFFER_SIZE: int = 1 << 20
+
+
+def count_xyz_frames(fpath) -> Tuple[int, bool]:
+    """Count the number of frames in an xyz file without parsing them.
+
+    Each frame starts with a line of the number of atoms, which is followed
+    by a comment line and one line per atom. Blank lines are only allowed at
+    the end of the file.
+
+    Returns:
+        The number of frames and whether all frames are in the extended xyz
+        format, whose comment lines define the properties of atoms.
+
+    """
+    nframes, is_extxyz = 0, True
+    with open(fpath, "rb") as fopen:
+        for line in fopen:
+            if not line.strip():
+                if any(line.strip() for line in fopen):
+                    raise ValueError(f"Blank line after frame {nframes} in {fpath}.")
+                break
+            try:
+                natoms = int(line)
+            except ValueError:
+                raise ValueError(
+                    f"Frame {nframes} in {fpath} does not start with the number of atoms."
+                )
+            comment = fopen.readline()
+            is_extxyz = is_extxyz and b"Properties=" in comment
+            natoms_read = sum(1 for _ in itertools.islice(fopen, natoms))
+            if not comment or natoms_read < natoms:
+                raise ValueError(f"Frame {nframes} in {fpath} is truncated.")
+            nframes += 1
+
+    return nframes, is_extxyz
+
+
+def append_xyz_file(fpath, fout, is_extxyz: bool = True) -> None:
+    """Append structures in an xyz file to an opened binary file.
+
+    Extended xyz files are copied as they are. Other files are parsed and
+    written back by ase so the dataset is always in the extended xyz format.
+
+    """
+    if is_extxyz:
+        with open(fpath, "rb") as fin:
+            # NOTE: Trailing blank lines are dropped as ase stops reading
+            #       the concatenated file at a blank line.
+            end = fin.seek(0, os.SEEK_END)
+            while end > 0:
+                start = max(0, end - DATASET_BUFFER_SIZE)
+                fin.seek(start)
+                content = fin.read(end - start).rstrip()
+                if content:
+                    end = start + len(content)
+                    break
+                end = start
+            fin.seek(0)
+            remained = end
+            while remained > 0:
+                content = fin.read(min(remained, DATASET_BUFFER_SIZE))
+                fout.write(content)
+                remained -= len(content)
+            if end > 0:
+                fout.write(b"\n")
+    else:
+        buffer = io.StringIO()
+        write(buffer, read(fpath, ":"), format="extxyz")
+        fout.write(buffer.getvalue().encode())
+
+    return
+
+
+class NequipModelWrapper:
+    """A deployed model evaluated by torch.compile or in mixed precision.
+
+    It replaces the model of a NequIPCalculator, which only calls its model
+    with the input data. The compiled model is created in the first
+    evaluation and is not copied, so copies of the calculator compile their
+    own. As compilation is lazy, errors only show up in the first evaluation
+    and the wrapper then switches back to the deployed model.
+
+    """
+
+    def __init__(
+        self, model, compile_model: bool = False, precision: str = "float32",
+        device: str = "cuda"
+    ) -> None:
+        """"""
+        self.model = model
+        self.compile_model = compile_model
+        self.precision = precision
+        self.device = device
+
+        self._compiled_model = None
+
+        return
+
+    def __getstate__(self) -> dict:
+        """"""
+        state = self.__dict__.copy()
+        state["_compiled_model"] = None
+
+        return state
+
+    def _evaluate(self, model, data):
+        """"""
+        import torch
+
+        if self.precision != "float32":
+            # NOTE: Parameters are kept in their own precision while autocast
+            #       runs eligible operations in the lower one, and forces are
+            #       still derived by autograd through the same graph.
+            with torch.autocast(
+                device_type=self.device, dtype=getattr(torch, self.precision)
+            ):
+                out = model(data)
+        else:
+            out = model(data)
+
+        return out
+
+    def __call__(self, data):
+        """"""
+        if self.compile_model and self._compiled_model is None:
+            import torch
+
+            try:
+                # NOTE: Shapes are dynamic as the numbers of atoms and edges
+                #       vary between structures.
+                self._compiled_model = torch.compile(self.model, dynamic=True)
+                out = self._evaluate(self._compiled_model, data)
+            except Exception as e:
+                warnings.warn(
+                    f"Failed to run the compiled model, use the deployed one: {e}",
+                    RuntimeWarning,
+                )
+                self.compile_model = False
+                self._compiled_model = None
+                out = self._evaluate(self.model, data)
+        elif self.compile_model:
+            out = self._evaluate(self._compiled_model, data)
+        else:
+            out = self._evaluate(self.model, data)
+
+        return out
+
+
 class NequipTrainer(AbstractTrainer):
 
     name = "nequip"
@@ -80,33 +238,42 @@ class NequipTrainer(AbstractTrainer):
         self._print(data_dirs)
         self._print("--- auto data reader ---")
 
-        frames = []
-        for i, curr_system in enumerate(data_dirs):
-            curr_system = pathlib.Path(curr_system)
-            self._print(f"System {curr_system.stem}\n")
-            curr_frames = []
-            subsystems = list(curr_system.glob("*.xyz"))
-            subsystems.sort() # sort by alphabet
-            for p in subsystems:
-                # read and split dataset
-                p_frames = read(p, ":")
-                p_nframes = len(p_frames)
-                curr_frames.extend(p_frames)
-                self._print(f"  subsystem: {p.name} number {p_nframes}")
-            self._print(f"  nframes {len(curr_frames)}")
-            frames.extend(curr_frames)
-        nframes = len(frames)
+        # NOTE: Extended xyz subsystem files are concatenated into the dataset
+        #       file as it is read by nequip via ase, which avoids parsing and
+        #       writing back all structures here. Other files still go through
+        #       ase. A large buffer reduces write calls.
+        dataset_path = os.fspath((self.directory/"dataset.xyz").resolve())
+        nframes = 0
+        with open(dataset_path, "wb", buffering=DATASET_BUFFER_SIZE) as fout:
+            for i, curr_system in enumerate(data_dirs):
+                curr_system = pathlib.Path(curr_system)
+                self._print(f"System {curr_system.stem}\n")
+                curr_nframes = 0
+                subsystems = list(curr_system.glob("*.xyz"))
+                subsystems.sort() # sort by alphabet
+                # NOTE: Files are scanned by threads as it is bound by file I/O.
+                if self.njobs > 1 and len(subsystems) > 1:
+                    subsystem_infos = Parallel(n_jobs=self.njobs, prefer="threads")(
+                        delayed(count_xyz_frames)(p) for p in subsystems
+                    )
+                else:
+                    subsystem_infos = [count_xyz_frames(p) for p in subsystems]
+                for p, (p_nframes, is_extxyz) in zip(subsystems, subsystem_infos):
+                    append_xyz_file(p, fout, is_extxyz=is_extxyz)
+                    curr_nframes += p_nframes
+                    self._print(f"  subsystem: {p.name} number {p_nframes}")
+                self._print(f"  nframes {curr_nframes}")
+                nframes += curr_nframes
         self._print(f"nframes {nframes}")
 
-        write(self.directory/"dataset.xyz", frames)
-
         n_train = int(nframes*dataset.train_ratio/dataset.batchsize)*dataset.batchsize
         n_val = nframes - n_train
 
         # - check train config
         # params: root, run_name, seed, dataset_seed, n_train, n_val, batch_size
         #         dataset, dataset_file_name
-        train_config = copy.deepcopy(self.config)
+        #         NOTE: Only top-level keys are updated so a shallow copy is enough.
+        train_config = {**self.config}
 
         train_config["root"] = str(self.directory.resolve())
         train_config["run_name"] = self.RUN_NAME
@@ -115,7 +282,7 @@ class NequipTrainer(AbstractTrainer):
         train_config["dataset_seed"] = self.rng.integers(0, 10000, dtype=int)
 
         train_config["dataset"] = "ase"
-        train_config["dataset_file_name"] = str((self.directory/"dataset.xyz").resolve())
+        train_config["dataset_file_name"] = dataset_path
 
         train_config["chemical_symbols"] = self.type_list
 
@@ -127,7 +294,7 @@ class NequipTrainer(AbstractTrainer):
         train_config["max_epochs"] = self.train_epochs
 
         with open(self.directory/f"{self.name}.yaml", "w") as fopen:
-            yaml.safe_dump(train_config, fopen)
+            yaml.dump(train_config, fopen, Dumper=SafeDumper)
 
         return
     
@@ -164,6 +331,10 @@ class NequipManager(AbstractPotentialManager):
         """"""
         self.committee = None
 
+        #: Calculators of deployed models keyed by the model path, the species
+        #: and the device, which only provide loaded models to new calculators.
+        self._nequip_models = {}
+
         return
 
     def _create_calculator(self, calc_params: dict) -> Calculator:
@@ -179,6 +350,12 @@ class NequipManager(AbstractPotentialManager):
         directory = calc_params.pop("directory", pathlib.Path.cwd())
         atypes = calc_params.pop("type_list", [])
 
+        # - whether compile models by torch.compile, only for the ase backend
+        compile_model = calc_params.pop("compile", False)
+
+        # - mixed precision of model evaluations on GPU, only for the ase backend
+        precision = calc_params.pop("precision", "float32")
+
         type_map = {}
         for i, a in enumerate(atypes):
             type_map[a] = i
@@ -204,12 +381,34 @@ class NequipManager(AbstractPotentialManager):
                 from nequip.ase import NequIPCalculator
             except:
                 raise ModuleNotFoundError("Please install nequip and torch to use the ase interface.")
+            device = "cuda" if torch.cuda.is_available() else "cpu"
             calcs = []
             for m in models:
-                curr_calc = NequIPCalculator.from_deployed_model(
-                    model_path=m, species_to_type_name={k:k for k in atypes},
-                    device=torch.device("cuda" if torch.cuda.is_available() else "cpu")
+                # NOTE: Loading a deployed model is expensive so loaded models
+                #       are reused, but each request gets a new calculator
+                #       that does not share results with others.
+                model_key = (m, tuple(atypes), device)
+                if model_key not in self._nequip_models:
+                    self._nequip_models[model_key] = NequIPCalculator.from_deployed_model(
+                        model_path=m, species_to_type_name={k:k for k in atypes},
+                        device=torch.device(device)
+                    )
+                loaded_calc = self._nequip_models[model_key]
+                curr_calc = NequIPCalculator(
+                    model=loaded_calc.model, r_max=loaded_calc.r_max,
+                    device=loaded_calc.device, transform=loaded_calc.transform
                 )
+                curr_precision = precision
+                if precision != "float32" and device != "cuda":
+                    warnings.warn(
+                        f"Precision {precision} is only used on GPU.", RuntimeWarning
+                    )
+                    curr_precision = "float32"
+                if compile_model or curr_precision != "float32":
+                    curr_calc.model = NequipModelWrapper(
+                        curr_calc.model, compile_model=compile_model,
+                        precision=curr_precision, device=device
+                    )
                 calcs.append(curr_calc)
             if len(calcs) == 1:
                 calc = calcs[0]
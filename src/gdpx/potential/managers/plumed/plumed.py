@@ -3,10 +3,41 @@
 
 
 import pathlib
+from typing import Dict, List, Tuple
 
 from .. import AbstractPotentialManager, DummyCalculator
 
 
+#: Parsed plumed inputs keyed by the file path and its modification time.
+_PLUMED_INPUTS: Dict[Tuple[str, int], List[str]] = {}
+
+
+def read_plumed_input(inp: pathlib.Path) -> List[str]:
+    """Read plumed input lines without comments.
+
+    The parsed lines are cached until the file is modified as many replicas
+    usually share the same input file.
+
+    """
+    inp = pathlib.Path(inp).absolute()
+    key = (str(inp), inp.stat().st_mtime_ns)
+    if key not in _PLUMED_INPUTS:
+        input_lines = []
+        with open(inp, "r") as fopen:
+            lines = fopen.readlines()
+            for line in lines:
+                line = line.strip()
+                if line and not line.startswith("#"):
+                    if "#" in line:
+                        line = line[: line.index("#")]
+                    else:
+                        line = line
+                    input_lines.append(line + "\n")
+        _PLUMED_INPUTS[key] = input_lines
+
+    return list(_PLUMED_INPUTS[key])
+
+
 class PlumedManager(AbstractPotentialManager):
 
     name = "plumed"
@@ -40,17 +71,7 @@ class PlumedManager(AbstractPotentialManager):
             if isinstance(inp, str) or isinstance(inp, pathlib.Path):
                 inp = pathlib.Path(inp)
                 if inp.exists():
-                    input_lines = []
-                    with open(inp, "r") as fopen:
-                        lines = fopen.readlines()
-                        for line in lines:
-                            line = line.strip()
-                            if line and not line.startswith("#"):
-                                if "#" in line:
-                                    line = line[: line.index("#")]
-                                else:
-                                    line = line
-                                input_lines.append(line + "\n")
+                    input_lines = read_plumed_input(inp)
                     self.calc_params.update(inp=input_lines)
                 else:
                     raise FileNotFoundError(f"{inp} does not exist.")
@@ -2,9 +2,12 @@
 # -*- coding: utf-8 -*
 
 import copy
+import os
 from pathlib import Path
 from typing import List
 
+import numpy as np
+
 import yaml
 
 from ase.calculators.calculator import Calculator
@@ -162,20 +165,22 @@ class BeannManager(AbstractPotentialManager):
         assert dataset, f"No dataset has been set for the potential {self.name}."
 
         # TODO: for now, only List[Atoms]
-        from gdpx.computation.utils import get_composition_from_atoms
+        from gdpx.computation.utils import get_formula_from_atoms
+        # NOTE: group by sorted atomic numbers, which is much cheaper than
+        #       counting symbols for every structure, and only name the group
+        #       by its formula when it is first found
         groups = {}
         for atoms in dataset:
-            composition = get_composition_from_atoms(atoms)
-            key = "".join([k+str(v) for k,v in composition])
-            if key in groups:
-                groups[key].append(atoms)
+            numbers_key = np.sort(atoms.numbers).tobytes()
+            if numbers_key in groups:
+                groups[numbers_key][1].append(atoms)
             else:
-                groups[key] = [atoms]
+                groups[numbers_key] = (get_formula_from_atoms(atoms), [atoms])
         from ase.io import read, write
         systems = []
         dataset_dir = train_dir/"dataset"
         dataset_dir.mkdir()
-        for key, frames in groups.items():
+        for key, frames in groups.values():
             k_dir = dataset_dir/key
             k_dir.mkdir()
             write(k_dir/"frames.xyz", frames)
@@ -213,9 +218,11 @@ class BeannManager(AbstractPotentialManager):
         # - find subdirs
         train_dir = Path(train_dir)
         mdirs = []
-        for p in train_dir.iterdir():
-            if p.is_dir() and p.name.startswith("m"):
-                mdirs.append(p.resolve())
+        # NOTE: scandir gives the entry type without an extra stat per entry
+        with os.scandir(train_dir) as it:
+            for entry in it:
+                if entry.name.startswith("m") and entry.is_dir():
+                    mdirs.append(Path(entry.path).resolve())
         assert len(mdirs) == self.train_size, "Number of models does not equal model size..."
 
         # - find models and form committee
@@ -5,7 +5,7 @@
 import abc
 import copy
 import dataclasses
-import itertools
+import os
 import pathlib
 import re
 import shutil
@@ -24,6 +24,47 @@ from ..reactor import AbstractReactor
 from ..utils import plot_bands, plot_mep, compute_rxn_coords
 
 
+#: Buffer size in bytes to write the band trajectory.
+TRAJ_BUFFER_SIZE: int = 1 << 20
+
+#: Pattern of the names of previous run directories.
+RUN_DIRNAME_PATTERN = re.compile(r"[0-9]{4}\.run")
+
+
+def scan_run_directories(directory: pathlib.Path) -> List[pathlib.Path]:
+    """Find previous run directories sorted by their names."""
+    if not directory.exists():
+        return []
+
+    with os.scandir(directory) as it:
+        run_dirs = sorted(
+            pathlib.Path(e.path) for e in it if RUN_DIRNAME_PATTERN.fullmatch(e.name)
+        )
+
+    return run_dirs
+
+
+def get_band_energies(band: List[Atoms]) -> np.ndarray:
+    """Get energies of images along a band.
+
+    Energies cached in the results of calculators are read directly, and
+    images without them (e.g. endpoints loaded from files) are computed.
+
+    """
+    energies = np.fromiter(
+        (
+            a.calc.results["energy"]
+            if a.calc is not None and "energy" in a.calc.results
+            else a.get_potential_energy()
+            for a in band
+        ),
+        dtype=np.float64,
+        count=len(band),
+    )
+
+    return energies
+
+
 @dataclasses.dataclass
 class StringReactorSetting:
 
@@ -149,16 +190,25 @@ class AbstractStringReactor(AbstractReactor):
             if band_frames:
                 # FIXME: make below a function
                 plot_mep(self.directory, band_frames[-1])
-                write(self.directory / "temptraj.xyz", itertools.chain(*band_frames))
+                # NOTE: Write bands one by one through a large buffer.
+                with open(
+                    self.directory / "temptraj.xyz", "w", buffering=TRAJ_BUFFER_SIZE
+                ) as fopen:
+                    for band in band_frames:
+                        write(fopen, band, format="extxyz")
 
                 curr_band = band_frames[-1]
 
                 rxn_coords = compute_rxn_coords(curr_band)
 
-                energies = [a.get_potential_energy() for a in curr_band]
-                imax = 1 + np.argsort(energies[1:-1])[-1]
+                energies = get_band_energies(curr_band)
+                imax = 1 + int(np.argmax(energies[1:-1]))
                 # NOTE: maxforce in cp2k is norm(atomic_forces)
-                maxfrc = np.max(curr_band[imax].get_forces(apply_constraint=True))
+                maxfrc = np.max(
+                    np.linalg.norm(
+                        curr_band[imax].get_forces(apply_constraint=True), axis=1
+                    )
+                )
 
                 self._print(
                     f"rxncoords: {rxn_coords[0]:.2f} -> {rxn_coords[imax]:.2f} "
@@ -193,7 +243,7 @@ class AbstractStringReactor(AbstractReactor):
     def _save_checkpoint(self, *args, **kwargs):
         """"""
         # - find previous runs...
-        prev_wdirs = sorted(self.directory.glob(r"[0-9][0-9][0-9][0-9][.]run"))
+        prev_wdirs = scan_run_directories(self.directory)
         self._debug(f"prev_wdirs: {prev_wdirs}")
         curr_index = len(prev_wdirs)
 
@@ -203,7 +253,7 @@ class AbstractStringReactor(AbstractReactor):
         # - backup files
         curr_wdir.mkdir()
         for x in self.directory.iterdir():
-            if not re.match(r"[0-9]{4}\.run", x.name):
+            if not RUN_DIRNAME_PATTERN.match(x.name):
                 # NOTE: default is to move everything to the new folder
                 # if x.name in self.saved_fnames:
                 #    shutil.move(x, curr_wdir)
@@ -296,7 +346,7 @@ class AbstractStringReactor(AbstractReactor):
     def read_trajectory(self, *args, **kwargs):
         """"""
         # - find previous runs...
-        prev_wdirs = sorted(self.directory.glob(r"[0-9][0-9][0-9][0-9][.]run"))
+        prev_wdirs = scan_run_directories(self.directory)
         self._debug(f"prev_wdirs: {prev_wdirs}")
 
         traj_list = []
@@ -330,10 +380,12 @@ class AbstractStringReactor(AbstractReactor):
 
             rxn_coords = compute_rxn_coords(curr_band)
 
-            energies = [a.get_potential_energy() for a in curr_band]
-            imax = 1 + np.argsort(energies[1:-1])[-1]
+            energies = get_band_energies(curr_band)
+            imax = 1 + int(np.argmax(energies[1:-1]))
             # NOTE: maxforce in cp2k is norm(atomic_forces)
-            maxfrc = np.max(curr_band[imax].get_forces(apply_constraint=True))
+            maxfrc = np.max(
+                np.linalg.norm(curr_band[imax].get_forces(apply_constraint=True), axis=1)
+            )
 
             self._print(f"imax: {imax}")
             self._print(
@@ -3,6 +3,7 @@
 
 
 import dataclasses
+import itertools
 import os
 import re
 import pathlib
@@ -12,8 +13,10 @@ from typing import Union, List
 
 import numpy as np
 
+from joblib import Parallel, delayed
+
 from ase import Atoms
-from ase.io import read, write
+from ase.io import read, iread, write
 from ase.calculators.singlepoint import SinglePointCalculator
 from ase.calculators.vasp import Vasp
 
@@ -44,6 +47,19 @@ def read_vaspout(
     return max(steps)
 
 
+def count_outcar_steps(fpath) -> int:
+    """Count the number of finished ionic steps in an OUTCAR without parsing it.
+
+    The file is streamed line by line as OUTCARs of long runs can be huge.
+
+    """
+    marker = b"FREE ENERGIE OF THE ION-ELECTRON SYSTEM"
+    with open(fpath, "rb") as fopen:
+        nsteps = sum(1 for line in fopen if marker in line)
+
+    return nsteps
+
+
 @dataclasses.dataclass
 class VaspStringReactorSetting(StringReactorSetting):
 
@@ -123,9 +139,10 @@ class VaspStringReactor(AbstractStringReactor):
         if verified:
             vasprun = self.directory / "01" / "OUTCAR"
             if vasprun.exists() and vasprun.stat().st_size != 0:
-                temp_frames = read(vasprun, ":")
+                # NOTE: Only the first frame is needed to verify the outputs.
+                temp_atoms = read(vasprun, 0)
                 try:
-                    _ = temp_frames[0].get_forces()
+                    _ = temp_atoms.get_forces()
                     verified = True
                 except:
                     verified = False
@@ -149,9 +166,14 @@ class VaspStringReactor(AbstractStringReactor):
             else:
                 self._print("update input images...")
                 # - update structures
-                rep_dirs = sorted(
-                    ckpt_wdir.glob(r"[0-9][0-9]"), key=lambda x: int(x.name)
-                )
+                with os.scandir(ckpt_wdir) as it:
+                    rep_dirs = sorted(
+                        (
+                            pathlib.Path(e.path) for e in it
+                            if len(e.name) == 2 and e.name.isdigit()
+                        ),
+                        key=lambda x: int(x.name)
+                    )
 
                 frames_ = []
                 for x in rep_dirs[1:-1]:
@@ -197,16 +219,10 @@ class VaspStringReactor(AbstractStringReactor):
                 os.remove(self.directory / "POSCAR")
 
             # -- add replica information
-            for i, a in enumerate(images):
-                rep_dir = self.directory / str(i).zfill(2)
-                # It has already been created when images are written.
-                # If the previous run has no outputs, we just overwrite everything.
-                rep_dir.mkdir(exist_ok=True)
-                write(
-                    rep_dir / "POSCAR",
-                    a[self.calc.sort],
-                    symbol_count=self.calc.symbol_count,
-                )
+            #    NOTE: Replicas are written by threads as it is bound by file I/O.
+            Parallel(n_jobs=len(images), prefer="threads")(
+                delayed(self._write_replica)(i, a) for i, a in enumerate(images)
+            )
 
             # - run calculation
             run_ase_calculator("vasp", atoms.calc.command, self.directory)
@@ -217,6 +233,20 @@ class VaspStringReactor(AbstractStringReactor):
 
         return
 
+    def _write_replica(self, i: int, atoms: Atoms) -> None:
+        """Write the POSCAR of the i-th replica."""
+        rep_dir = self.directory / str(i).zfill(2)
+        # It has already been created when images are written.
+        # If the previous run has no outputs, we just overwrite everything.
+        rep_dir.mkdir(exist_ok=True)
+        write(
+            rep_dir / "POSCAR",
+            atoms[self.calc.sort],
+            symbol_count=self.calc.symbol_count,
+        )
+
+        return
+
     def read_convergence(self, *args, **kwargs):
         """Check whether vasp-neb is converged.
 
@@ -278,30 +308,36 @@ class VaspStringReactor(AbstractStringReactor):
             natoms = len(ini_atoms)
             sort, resort = list(range(natoms)), list(range(natoms))
 
+        # nframes may not consistent across replicas
+        # due to unfinished calculations
+        outcar_paths = [
+            wdir / f"{str(i).zfill(2)}" / "OUTCAR"
+            for i in range(1, self.setting.nimages - 1)
+        ]
+        nsteps = min(count_outcar_steps(p) for p in outcar_paths)
+
+        # NOTE: Steps beyond the shortest replica are never parsed.
         frames_ = []
-        for i in range(1, self.setting.nimages - 1):
-            curr_frames = read(wdir / f"{str(i).zfill(2)}" / "OUTCAR", ":")
-            sorted_frames = []
-            for a in curr_frames:
-                sorted_atoms = resort_atoms_with_spc(
+        for p in outcar_paths:
+            curr_frames = list(itertools.islice(iread(p, index=":"), nsteps))
+            frames_.append(curr_frames)
+        nsteps = min(len(x) for x in frames_)
+
+        # NOTE: Only the steps shared by all replicas are resorted, and bands
+        #       are gathered by transposing the replica trajectories.
+        frames_ = [
+            [
+                resort_atoms_with_spc(
                     a, resort, "vasp", print_func=self._print, debug_func=self._debug
                 )
-                sorted_frames.append(sorted_atoms)
-            frames_.append(sorted_frames)
-
-        # nframes may not consistent across replicas
-        # due to unfinished calculations
-        nframes_list = [len(x) for x in frames_]
-        nsteps = min(nframes_list)
-
-        frames = []
-        for i in range(nsteps):
-            curr_frames = (
-                [ini_atoms]
-                + [frames_[j][i] for j in range(self.setting.nimages - 2)]
-                + [fin_atoms]
-            )
-            frames.append(curr_frames)
+                for a in curr_frames[:nsteps]
+            ]
+            for curr_frames in frames_
+        ]
+        frames = [
+            [ini_atoms] + list(intermediates) + [fin_atoms]
+            for intermediates in zip(*frames_)
+        ]
 
         return frames
 
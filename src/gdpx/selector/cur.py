@@ -92,6 +92,7 @@ def cur_selection(
     assert features.ndim == 2
     nframes = features.shape[0]
 
+    # NOTE: Features may be a read-only memory map so they are copied here.
     at_descs = features.copy().T
 
     # do SVD on kernel if desired
@@ -375,15 +375,12 @@ class PropertySelector(AbstractSelector):
         curr_indices, scores = [], []
         if prop_item.sparsify == "filter":
             # -- select current property
-            # TODO: possibly use np.where to replace this code
+            prop_arr = np.asarray(prop_vals)
             if not prop_item.reverse:
-                for i in range(nframes):
-                    if prop_item.pmin <= prop_vals[i] <= prop_item.pmax:
-                        curr_indices.append(i)
+                mask = (prop_item.pmin <= prop_arr) & (prop_arr <= prop_item.pmax)
             else:
-                for i in range(nframes):
-                    if prop_item.pmin > prop_vals[i] and prop_vals[i] > prop_item.pmax:
-                        curr_indices.append(i)
+                mask = (prop_item.pmin > prop_arr) & (prop_arr > prop_item.pmax)
+            curr_indices = np.flatnonzero(mask).tolist()
             scores = [prop_vals[i] for i in curr_indices]
         elif prop_item.sparsify == "sort":
             numbers = list(range(nframes))
@@ -3,11 +3,17 @@
 
 
 import os
+import re
+import shlex
 import subprocess
 
 from ase.calculators.calculator import EnvironmentError, CalculationFailed
 
 
+#: Characters that need a shell to interpret the command.
+SHELL_METACHARACTERS = re.compile(r"[|&;<>()$`\\*?~=\[{#\n]")
+
+
 def run_ase_calculator(name: str, command, directory):
     """Run vasp from the command.
 
@@ -17,8 +23,15 @@ def run_ase_calculator(name: str, command, directory):
     For example, we use existed INCAR for VASP.
 
     """
+    # NOTE: Launch the command without a shell unless it uses shell features,
+    #       for example, redirecting outputs to a file.
+    if isinstance(command, str) and SHELL_METACHARACTERS.search(command) is None:
+        args, shell = shlex.split(command), False
+    else:
+        args, shell = command, isinstance(command, str)
+
     try:
-        proc = subprocess.Popen(command, shell=True, cwd=directory)
+        proc = subprocess.Popen(args, shell=shell, cwd=directory)
     except OSError as err:
         # Actually this may never happen with shell=True, since
         # probably the shell launches successfully.  But we soon want
@@ -60,7 +60,7 @@ def calc_desc(frames):
     features_path = cwd / "features.npy"
     if features_path.exists():
         print("use precalculated features...")
-        features = np.load(features_path)
+        features = np.load(features_path, mmap_mode='r')
         assert features.shape[0] == len(frames)
     else:
         print('start calculating features...')
@@ -77,16 +77,17 @@ def select_structures(
     """
     # cur decomposition 
     cur_scores, selected = cur_selection(features, num, zeta, strategy)
-    content = '# idx cur sel\n'
+    selected_set = set(int(x) for x in selected)
+    lines = ['# idx cur sel\n']
     for idx, cur_score in enumerate(cur_scores):
         stat = 'F'
-        if idx in selected:
+        if idx in selected_set:
             stat = 'T'
         if index_map is not None:
             idx = index_map[idx]
-        content += '{:>12d}  {:>12.8f}  {:>2s}\n'.format(idx, cur_score, stat) 
+        lines.append('{:>12d}  {:>12.8f}  {:>2s}\n'.format(idx, cur_score, stat))
     with open(cwd / (prefix+"cur_scores.txt"), 'w') as writer:
-        writer.write(content)
+        writer.write("".join(lines))
 
     # map selected indices
     if index_map is not None:
@@ -95,9 +96,7 @@ def select_structures(
         selected.extend(manually_selected)
     np.save(cwd / (prefix+"indices.npy"), selected)
 
-    selected_frames = []
-    for idx, sidx in enumerate(selected):
-        selected_frames.append(frames[int(sidx)])
+    selected_frames = [frames[int(sidx)] for sidx in selected]
 
     return selected_frames
 
@@ -177,7 +176,7 @@ else:
 
     if previous_indices_path.exists() and args.more:
         features_path = cwd / "features.npy"
-        features = np.load(features_path)
+        features = np.load(features_path, mmap_mode='r')
 
         assert len(frames) == features.shape[0]
 
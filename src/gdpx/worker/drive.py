@@ -806,8 +806,23 @@ class CommandDriverBasedWorker(DriverBasedWorker):
         curr_frames = [frames[i] for i in curr_indices]
 
         # - run calculations
+        #   NOTE: Only callers that know the driver is safe to copy into other
+        #         processes (e.g. the GA's initial population with the ase
+        #         driver) request n_jobs, `gdp -nj` never enables this.
+        n_jobs = kwargs.get("n_jobs", 1)
         with CustomTimer(name="run-driver", func=self._print):
-            if not self._share_wdir:
+            if not self._share_wdir and n_jobs > 1:
+                # NOTE: Structures are independent and each writes outputs to
+                #       its own wdir, so they can run in parallel. Every job
+                #       receives a pickled copy of the driver.
+                self._print(
+                    f"{time.asctime( time.localtime(time.time()) )} {len(curr_frames)} structures are running with {n_jobs} jobs..."
+                )
+                _ = Parallel(n_jobs=n_jobs)(
+                    delayed(self._irun_driver)(self.driver, self.directory / wdir, atoms, rs)
+                    for wdir, atoms, rs in zip(curr_wdirs, curr_frames, rng_states)
+                )
+            elif not self._share_wdir:
                 for wdir, atoms, rs in zip(curr_wdirs, curr_frames, rng_states):
                     self.driver.directory = self.directory / wdir
                     prev_random_seed = self.driver.random_seed
@@ -857,6 +872,21 @@ class CommandDriverBasedWorker(DriverBasedWorker):
 
         return
 
+    @staticmethod
+    def _irun_driver(driver, directory: pathlib.Path, atoms: Atoms, rng_state) -> None:
+        """Run one structure with the given driver.
+
+        This must be a staticmethod as it may be pickled by joblib for parallel
+        runs.
+
+        """
+        driver.directory = directory
+        driver.set_rng(seed=rng_state)
+        driver.reset()
+        driver.run(atoms, read_ckpt=True, extra_info=None)
+
+        return
+
 
 if __name__ == "__main__":
     ...
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+import pytest
+
+from ase.build import add_adsorbate, fcc111, molecule
+from ase.ga.utilities import closest_distances_generator
+
+from gdpx.builder.mutation.rattle import VectorisedRattleMutation
+
+
+def create_slab_with_adsorbates():
+    """A Pt(111) slab with three tagged CO molecules."""
+    atoms = fcc111("Pt", size=(3, 3, 2), vacuum=8.0)
+    atoms.set_tags(0)
+    for i, position in enumerate([(0.0, 0.0), (2.8, 1.6), (5.5, 3.2)]):
+        adsorbate = molecule("CO")
+        adsorbate.set_tags(i + 1)
+        add_adsorbate(atoms, adsorbate, height=1.9, position=position)
+
+    return atoms
+
+
+@pytest.mark.basic
+@pytest.mark.parametrize("seed", [1112, 1113, 1114])
+def test_rattle(seed):
+    """"""
+    atoms = create_slab_with_adsorbates()
+    num_slab = np.sum(atoms.get_tags() == 0)
+    n_top = len(atoms) - num_slab
+
+    blmin = closest_distances_generator(
+        atom_numbers=[6, 8, 78], ratio_of_covalent_radii=0.7
+    )
+    mutation = VectorisedRattleMutation(
+        blmin, n_top, rattle_strength=1.5, rattle_prop=0.5,
+        test_dist_to_slab=True, use_tags=True, rng=np.random.RandomState(seed)
+    )
+    mutant = mutation.mutate(atoms)
+    assert mutant is not None
+
+    # - the slab is not modified
+    assert np.allclose(mutant.positions[:num_slab], atoms.positions[:num_slab])
+    assert np.all(mutant.get_tags() == atoms.get_tags())
+
+    # - tagged groups move as units, others stay put
+    displacements = mutant.positions - atoms.positions
+    tags = atoms.get_tags()
+    num_moved = 0
+    for tag in np.unique(tags[num_slab:]):
+        group_displacements = displacements[tags == tag]
+        assert np.allclose(group_displacements, group_displacements[0])
+        if not np.allclose(group_displacements[0], 0.0):
+            num_moved += 1
+    assert num_moved > 0
+
+    # - no pair between different groups is closer than blmin
+    numbers = mutant.get_atomic_numbers()
+    distances = mutant.get_all_distances(mic=True)
+    for i in range(num_slab, len(mutant)):
+        for j in range(len(mutant)):
+            if tags[i] == tags[j]:
+                continue
+            assert distances[i, j] >= blmin[(numbers[i], numbers[j])]
+
+    return
+
+
+if __name__ == "__main__":
+    ...
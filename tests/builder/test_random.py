@@ -3,6 +3,8 @@
 
 import numpy as np
 
+import pytest
+
 from ase.io import read, write
 
 from gdpx.core.register import import_all_modules_for_register
@@ -20,6 +22,34 @@ def test_number():
     assert number == 102
 
 
+@pytest.mark.parametrize("size,min_parallel_size", [(8, None), (8, 4)])
+def test_cluster_njobs(size, min_parallel_size):
+    """"""
+    params = dict(
+        composition = {"Pt": 8},
+        cell = (np.eye(3)*20.).tolist(),
+        region = dict(
+            method = "lattice",
+            origin = [7.5, 7.5, 7.5],
+            cell = (5.*np.eye(3)).flatten()
+        ),
+        covalent_ratio = [0.6, 2.0],
+        test_too_far = False,
+        min_parallel_size = min_parallel_size,
+        random_seed = 1112
+    )
+
+    structures = []
+    for njobs in [1, 2]:
+        builder = ClusterBuilder(**params)
+        builder.njobs = njobs
+        structures.append(builder.run(size=size))
+
+    assert len(structures[0]) == size
+    for a1, a2 in zip(*structures):
+        assert np.allclose(a1.positions, a2.positions)
+
+
 def test_surface():
     """"""
     params = dict(
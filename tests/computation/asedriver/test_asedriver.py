@@ -71,6 +71,35 @@ def test_ase_nvt(dump_period, num_frames):
     return
 
 
+def test_ase_min_njobs():
+    """"""
+    structures = read("./assets/Pd38_oct.xyz", ":")
+    structures = [structures[0], structures[0].copy()]
+    structures[1].rattle(stdev=0.05, seed=1112)
+
+    with open("./assets/emtmin.yaml", "r") as fopen:
+        worker_params = yaml.safe_load(fopen)
+
+    results = []
+    for n_jobs in [1, 2]:
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            worker = convert_config_to_potter(copy.deepcopy(worker_params))[0]
+            worker.directory = tmpdirname
+            worker.batchsize = 2
+
+            worker.run(structures, n_jobs=n_jobs)
+            results.append(worker.retrieve(include_retrieved=True))
+
+    assert len(results[1]) == 2
+    for traj_serial, traj_parallel in zip(*results):
+        assert len(traj_parallel) == 24
+        assert traj_parallel[-1].get_potential_energy() == pytest.approx(
+            traj_serial[-1].get_potential_energy()
+        )
+
+    return
+
+
 @pytest.mark.parametrize("dump_period,ckpt_period", [(1, 1), (1, 3), (3, 5), (3, 7)])
 # @pytest.mark.parametrize("dump_period,ckpt_period", [(1, 1)])
 def test_ase_min_restart(dump_period, ckpt_period):
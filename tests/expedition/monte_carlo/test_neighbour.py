@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+import pytest
+
+from ase import Atoms
+from ase.build import bulk, fcc111, molecule
+from ase.neighborlist import NeighborList, natural_cutoffs
+
+from gdpx.expedition.monte_carlo.operators.operator import SpeciesNeighbourList
+
+
+def create_skewed_cell():
+    """"""
+    atoms = bulk("Cu", "fcc", a=3.6) * (2, 2, 2)
+    atoms.set_cell(
+        atoms.cell.array + np.array([[0.0, 0.0, 0.0], [1.8, 0.0, 0.0], [0.9, 1.3, 0.0]]),
+        scale_atoms=True
+    )
+    atoms.rattle(stdev=0.1, seed=1112)
+
+    return atoms
+
+
+def create_small_cell():
+    """A cell whose lengths are shorter than twice the cutoffs."""
+    atoms = Atoms(
+        "PtO", positions=[[0.0, 0.0, 0.0], [1.0, 1.1, 0.9]],
+        cell=[[2.5, 0.0, 0.0], [0.8, 2.6, 0.0], [0.3, 0.4, 2.4]], pbc=True
+    )
+
+    return atoms
+
+
+@pytest.mark.basic
+@pytest.mark.parametrize(
+    "name,atoms,scale",
+    [
+        ("slab", fcc111("Pt", size=(3, 3, 4), vacuum=8.0), 1.2),
+        ("bulk", bulk("Pt", "fcc", a=3.92, cubic=True) * (2, 2, 2), 1.2),
+        ("skewed", create_skewed_cell(), 1.2),
+        ("molecule", molecule("CH3CH2OH"), 1.2),
+        ("small", create_small_cell(), 3.0),
+    ]
+)
+def test_neighbours(name, atoms, scale):
+    """"""
+    cutoffs = np.array(natural_cutoffs(atoms, mult=scale))
+
+    ase_nl = NeighborList(
+        cutoffs, skin=0.0, self_interaction=False, bothways=True
+    )
+    ase_nl.update(atoms)
+
+    nl = SpeciesNeighbourList(cutoffs)
+    nl.update(atoms)
+
+    for i in range(len(atoms)):
+        ase_indices, ase_offsets = ase_nl.get_neighbors(i)
+        indices, offsets = nl.get_neighbors(i)
+        ase_neighbours = sorted(
+            (int(j), tuple(int(x) for x in o)) for j, o in zip(ase_indices, ase_offsets)
+        )
+        neighbours = sorted(
+            (int(j), tuple(int(x) for x in o)) for j, o in zip(indices, offsets)
+        )
+        assert neighbours == ase_neighbours
+
+    return
+
+
+if __name__ == "__main__":
+    ...
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import copy
+import tempfile
+import pathlib
+
+import numpy as np
+
+import pytest
+
+from ase.build import molecule
+from ase.calculators.singlepoint import SinglePointCalculator
+from ase.io import write
+
+from gdpx.potential.managers.deepmd.convert import convert_frames_to_system
+
+
+TYPE_MAP = ["C", "H", "O"]
+
+
+def create_frames():
+    """Labelled frames of the same composition with different atom orders."""
+    rng = np.random.default_rng(1112)
+
+    frames = []
+    for i in range(4):
+        atoms = molecule("CH3CH2OH")
+        atoms.set_cell(np.eye(3) * 12.0 + rng.uniform(-0.2, 0.2, (3, 3)))
+        atoms.pbc = True
+        atoms.rattle(stdev=0.05, seed=i)
+        if i > 0:
+            atoms = atoms[rng.permutation(len(atoms))]
+        atoms.calc = SinglePointCalculator(
+            atoms, energy=rng.uniform(-40.0, -30.0),
+            forces=rng.uniform(-1.0, 1.0, (len(atoms), 3))
+        )
+        frames.append(atoms)
+
+    return frames
+
+
+def convert_frames_by_xyz(frames, type_map, directory):
+    """Convert frames by dpdata's xyz reader."""
+    import dpdata
+
+    frames_ = copy.deepcopy(frames)
+    for atoms in frames_:
+        forces = atoms.calc.results["forces"].copy()
+        atoms.info["energy"] = atoms.calc.results["energy"]
+        atoms.arrays["force"] = forces
+        atoms.calc = None
+    write(directory / "frames.xyz", frames_)
+    dsys = dpdata.MultiSystems.from_file(
+        directory / "frames.xyz", fmt="quip/gap/xyz", type_map=type_map
+    )
+
+    return dsys[0]
+
+
+def test_convert_frames():
+    """"""
+    pytest.importorskip("dpdata")
+
+    frames = create_frames()
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        ref_sys = convert_frames_by_xyz(frames, TYPE_MAP, pathlib.Path(tmpdirname))
+    dsys = convert_frames_to_system(frames, TYPE_MAP, pbc=True)
+
+    assert dsys.get_nframes() == ref_sys.get_nframes()
+    assert dsys["atom_names"] == ref_sys["atom_names"]
+    assert list(dsys["atom_numbs"]) == list(ref_sys["atom_numbs"])
+    assert np.array_equal(dsys["atom_types"], ref_sys["atom_types"])
+    for k in ["cells", "coords", "energies", "forces"]:
+        assert np.allclose(dsys[k], ref_sys[k]), k
+
+    return
+
+
+def test_convert_unlabelled_frames():
+    """"""
+    frames = create_frames()
+    frames[2].calc = None
+
+    with pytest.raises(ValueError, match="Frame 2"):
+        _ = convert_frames_to_system(frames, TYPE_MAP, pbc=True)
+
+    return
+
+
+if __name__ == "__main__":
+    ...
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*
+
+import copy
+import pathlib
+import tempfile
+from typing import Dict
+
+import numpy as np
+
+import pytest
+
+from ase.build import molecule
+
+from gdpx.potential.managers.nequip import NequipManager, NequipModelWrapper
+
+torch = pytest.importorskip("torch")
+pytest.importorskip("nequip")
+
+
+class HarmonicModel(torch.nn.Module):
+    """A toy model whose energy is the half sum of squared positions."""
+
+    def forward(self, data: Dict[str, torch.Tensor]) -> Dict[str, torch.Tensor]:
+        """"""
+        positions = data["pos"]
+        data["total_energy"] = (0.5 * torch.sum(positions**2)).reshape(1, 1)
+        data["forces"] = -positions
+
+        return data
+
+
+def deploy_model(model_path: pathlib.Path) -> None:
+    """Save the toy model as a deployed nequip model."""
+    metadata = dict(
+        nequip_version="0.6.2",
+        r_max="4.0",
+        n_species="3",
+        type_names="C H O",
+        allow_tf32="0",
+        default_dtype="float64",
+        model_dtype="float64",
+    )
+    torch.jit.save(
+        torch.jit.script(HarmonicModel()), str(model_path), _extra_files=metadata
+    )
+
+    return
+
+
+@pytest.fixture
+def model_path():
+    """"""
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        model_path = pathlib.Path(tmpdirname) / "nequip.pth"
+        deploy_model(model_path)
+        yield model_path
+
+    return
+
+
+def create_calculator(model_path, **kwargs):
+    """"""
+    potter = NequipManager()
+    potter.register_calculator(
+        dict(backend="ase", type_list=["C", "H", "O"], model=str(model_path), **kwargs)
+    )
+
+    return potter, potter.calc
+
+
+def test_compiled_calculator_copy(model_path):
+    """"""
+    _, calc = create_calculator(model_path, compile=True)
+    assert isinstance(calc.model, NequipModelWrapper)
+
+    new_calc = copy.deepcopy(calc)
+
+    atoms = molecule("CH3OH")
+    atoms.calc = new_calc
+    forces = atoms.get_forces()
+
+    assert np.allclose(forces, -atoms.positions, atol=1e-5)
+    assert atoms.get_potential_energy() == pytest.approx(
+        0.5 * np.sum(atoms.positions**2), abs=1e-4
+    )
+    assert calc.results == {}
+
+    return
+
+
+def test_reuse_loaded_model(model_path):
+    """"""
+    potter, calc = create_calculator(model_path)
+    potter.register_calculator(
+        dict(backend="ase", type_list=["C", "H", "O"], model=str(model_path))
+    )
+    new_calc = potter.calc
+
+    assert new_calc is not calc
+    assert new_calc.model is calc.model
+
+    atoms = molecule("CH3OH")
+    atoms.calc = new_calc
+    _ = atoms.get_forces()
+
+    assert new_calc.results
+    assert calc.results == {}
+
+    return
+
+
+def test_autocast_calculator_copy(model_path):
+    """"""
+    from nequip.ase import NequIPCalculator
+
+    calc = NequIPCalculator.from_deployed_model(
+        model_path=str(model_path), species_to_type_name={k: k for k in "CHO"}
+    )
+    calc.model = NequipModelWrapper(calc.model, precision="bfloat16", device="cpu")
+
+    new_calc = copy.deepcopy(calc)
+
+    atoms = molecule("CH3OH")
+    atoms.calc = new_calc
+    forces = atoms.get_forces()
+
+    assert np.allclose(forces, -atoms.positions, atol=1e-5)
+    assert calc.results == {}
+
+    return
+
+
+if __name__ == "__main__":
+    ...
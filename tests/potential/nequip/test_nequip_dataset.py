@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*
+
+import pathlib
+import tempfile
+
+import numpy as np
+
+import pytest
+
+from ase.build import molecule
+from ase.calculators.singlepoint import SinglePointCalculator
+from ase.io import read, write
+
+from gdpx.potential.managers.nequip import append_xyz_file, count_xyz_frames
+
+
+def create_frames(name: str, nframes: int):
+    """"""
+    frames = []
+    for i in range(nframes):
+        atoms = molecule(name)
+        atoms.rattle(stdev=0.05, seed=i)
+        atoms.calc = SinglePointCalculator(
+            atoms, energy=-float(i), forces=np.full((len(atoms), 3), float(i))
+        )
+        frames.append(atoms)
+
+    return frames
+
+
+def test_concatenate_xyz():
+    """"""
+    frames_a = create_frames("H2O", 3)
+    frames_b = create_frames("CH4", 2)
+    frames_c = create_frames("CO", 2)
+
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        directory = pathlib.Path(tmpdirname)
+        write(directory / "a.xyz", frames_a)
+        # - remove the trailing newline
+        write(directory / "b.xyz", frames_b)
+        content = (directory / "b.xyz").read_bytes()
+        (directory / "b.xyz").write_bytes(content.rstrip(b"\n"))
+        # - add trailing blank lines
+        (directory / "a.xyz").write_bytes(
+            (directory / "a.xyz").read_bytes() + b"\n\n"
+        )
+        # - plain xyz without properties in comment lines
+        write(directory / "c.xyz", frames_c, format="xyz")
+
+        nframes = 0
+        with open(directory / "dataset.xyz", "wb") as fout:
+            for name in ["a", "b", "c"]:
+                p_nframes, is_extxyz = count_xyz_frames(directory / f"{name}.xyz")
+                append_xyz_file(directory / f"{name}.xyz", fout, is_extxyz)
+                nframes += p_nframes
+                assert is_extxyz == (name != "c")
+
+        dataset = read(directory / "dataset.xyz", ":")
+
+    assert nframes == 7
+    assert len(dataset) == 7
+    for atoms, ref_atoms in zip(dataset, frames_a + frames_b + frames_c):
+        assert atoms.get_chemical_formula() == ref_atoms.get_chemical_formula()
+        assert np.allclose(atoms.positions, ref_atoms.positions)
+    for atoms, ref_atoms in zip(dataset[:5], frames_a + frames_b):
+        assert atoms.get_potential_energy() == pytest.approx(
+            ref_atoms.get_potential_energy()
+        )
+
+    return
+
+
+def test_count_invalid_xyz():
+    """"""
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        directory = pathlib.Path(tmpdirname)
+        write(directory / "a.xyz", create_frames("H2O", 2))
+        lines = (directory / "a.xyz").read_bytes().splitlines(keepends=True)
+
+        # - a blank line between frames
+        (directory / "b.xyz").write_bytes(b"".join(lines[:5] + [b"\n"] + lines[5:]))
+        with pytest.raises(ValueError, match="Blank line"):
+            _ = count_xyz_frames(directory / "b.xyz")
+
+        # - a truncated frame
+        (directory / "c.xyz").write_bytes(b"".join(lines[:-1]))
+        with pytest.raises(ValueError, match="truncated"):
+            _ = count_xyz_frames(directory / "c.xyz")
+
+    return
+
+
+if __name__ == "__main__":
+    ...
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import pathlib
+import tempfile
+
+import numpy as np
+
+import pytest
+
+from ase.build import fcc111, add_adsorbate
+from ase.calculators.emt import EMT
+from ase.calculators.singlepoint import SinglePointCalculator
+from ase.io import read, write
+
+from gdpx.reactor.string.string import get_band_energies
+
+
+def test_band_energies():
+    """"""
+    initial = fcc111("Pt", size=(2, 2, 3), vacuum=6.0)
+    add_adsorbate(initial, "O", height=1.5, position="fcc")
+    final = initial.copy()
+    final.positions[-1, 0] += 1.4
+
+    # - endpoints are loaded from disk without any results
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        write(pathlib.Path(tmpdirname) / "IS.vasp", initial)
+        write(pathlib.Path(tmpdirname) / "FS.vasp", final)
+        initial = read(pathlib.Path(tmpdirname) / "IS.vasp")
+        final = read(pathlib.Path(tmpdirname) / "FS.vasp")
+    assert initial.calc is None
+
+    # - intermediate images carry single-point results
+    intermediates = []
+    for i in range(3):
+        atoms = initial.copy()
+        atoms.positions[-1, 0] += 0.35 * (i + 1)
+        atoms.calc = EMT()
+        energy, forces = atoms.get_potential_energy(), atoms.get_forces()
+        atoms.calc = SinglePointCalculator(atoms, energy=energy, forces=forces)
+        intermediates.append(atoms)
+
+    initial.calc, final.calc = EMT(), EMT()
+    band = [initial] + intermediates + [final]
+    energies = get_band_energies(band)
+
+    references = []
+    for atoms in band:
+        curr_atoms = atoms.copy()
+        curr_atoms.calc = EMT()
+        references.append(curr_atoms.get_potential_energy())
+
+    assert np.allclose(energies, references)
+
+    return
+
+
+if __name__ == "__main__":
+    ...